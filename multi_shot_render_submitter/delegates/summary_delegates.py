@@ -4,10 +4,10 @@ import logging
 import os
 
 from Qt.QtWidgets import (QTreeView, QItemDelegate, QComboBox,
-    QLineEdit, QCheckBox, QFrame, QHBoxLayout)
+    QLineEdit, QCheckBox, QFrame)
 from Qt.QtGui import QIcon, QFont
 from Qt.QtCore import (Qt, QSortFilterProxyModel, QSize,
-    Signal, QModelIndex, QEvent)
+    Signal, QModelIndex, QEvent, QTimer)
 
 import srnd_qt.base.utils
 from srnd_qt.ui_framework.models.base_abstract_item_model import BaseAbstractItemDelegates
@@ -16,6 +16,10 @@ from srnd_multi_shot_render_submitter.widgets import post_tasks_combo_box
 from srnd_multi_shot_render_submitter.widgets import validation_hints_widget
 
 
+# Milliseconds to wait for typing to pause before committing note edits
+NOTE_COMMIT_DELAY_MS = 150
+
+
 ##############################################################################
 
 
@@ -26,6 +30,7 @@ class SummaryDelegates(BaseAbstractItemDelegates):
     Args:
         debug_mode (bool):
         summary_model (SummaryModel): pass a pointer to the single summary model
+        summary_view (SummaryView): pass a pointer to the summary view editors are within
     '''
 
     logMessage = Signal(str, int)
@@ -34,10 +39,70 @@ class SummaryDelegates(BaseAbstractItemDelegates):
             self,
             debug_mode=False,
             summary_model=None,
+            summary_view=None,
             parent=None,
             **kwargs):
         super(SummaryDelegates, self).__init__(parent=parent)
         self._summary_model = summary_model
+        self._summary_view = summary_view
+        # Column to (get value, set value, must match environment) for editors,
+        # used to propagate an edited value to editors of other selected rows.
+        self._propagators = dict()
+        if summary_model:
+            self._propagators[summary_model.COLUMN_OF_POST_TASK] = (
+                lambda widget: widget.get_checked_post_tasks(),
+                lambda widget, value: widget.set_post_task_check_states(value),
+                True)
+            self._propagators[summary_model.COLUMN_OF_KOBA_SHOTSUB] = (
+                lambda widget: widget.isChecked(),
+                lambda widget, value: widget.setChecked(value),
+                False)
+            self._propagators[summary_model.COLUMN_OF_SUBMISSION_NOTE] = (
+                lambda widget: str(widget.text()),
+                lambda widget, value: widget.setText(value),
+                False)
+        self._propagating = False
+        # Validation hints are painted directly, so only load the icon pixmaps once
+        self._validation_hint_pixmaps = validation_hints_widget.get_validation_hint_pixmaps()
+
+
+    def paint(self, painter, option_style, qmodelindex):
+        '''
+        Paint the validation hints of environments directly, rather than
+        requiring a persistent editor widget for every row.
+        Reimplemented virtual method.
+
+        Args:
+            painter (QtGui.QPainter):
+            option_style (QtGui.QStyleOptionViewItem):
+            qmodelindex (QtCore.QModelIndex):
+        '''
+        BaseAbstractItemDelegates.paint(self, painter, option_style, qmodelindex)
+
+        if not self._summary_model or not qmodelindex.isValid():
+            return
+        if qmodelindex.column() != self._summary_model.COLUMN_OF_VALIDATION:
+            return
+
+        item = self._map_to_source(qmodelindex).internalPointer()
+        if not item or not item.is_environment_item():
+            return
+
+        # NOTE: Counters are read from the item, which is the only source of truth.
+        # Items are shared with MultiShotRenderModel and rows are per parent,
+        # so mirroring values into per row arrays on SummaryModel would go stale.
+        pixmap_critical, pixmap_warning = self._validation_hint_pixmaps
+        painter.save()
+        try:
+            validation_hints_widget.paint_validation_hints(
+                painter,
+                option_style.rect,
+                item.get_validation_critical_counter(),
+                item.get_validation_warning_counter(),
+                pixmap_critical=pixmap_critical,
+                pixmap_warning=pixmap_warning)
+        finally:
+            painter.restore()
 
 
     def createEditor(self, parent_widget, option_style, qmodelindex):
@@ -56,29 +121,19 @@ class SummaryDelegates(BaseAbstractItemDelegates):
         if not qmodelindex.isValid():
            return None
 
-        model = qmodelindex.model()
-        source_model = model
-        if isinstance(model, QSortFilterProxyModel):
-            qmodelindex = model.mapToSource(qmodelindex)
-            source_model = model.sourceModel()
-
+        source_model = self._get_summary_model(qmodelindex)
         c = qmodelindex.column()
+        if c not in self._get_editor_columns(source_model):
+            return None
+
+        qmodelindex = self._map_to_source(qmodelindex)
         item = qmodelindex.internalPointer()
         if not item or item.is_group_item():
             return None
 
-        is_environment_item = item.is_environment_item()
-
+        # NOTE: Validation hints are painted by paint, so dont require an editor widget
         widget = None
-        if c == source_model.COLUMN_OF_VALIDATION and is_environment_item:
-            widget = validation_hints_widget.ValidationHintsWidget(
-                critical_count=item.get_validation_warning_counter(),
-                warning_count=item.get_validation_critical_counter(),
-                parent=parent_widget)
-            widget.setContextMenuPolicy(Qt.NoContextMenu)
-            widget.setFixedHeight(source_model.NORMAL_ROW_HEIGHT)
-
-        elif c == source_model.COLUMN_OF_POST_TASK:
+        if c == source_model.COLUMN_OF_POST_TASK:
             post_tasks_combo_box_object = self.get_post_tasks_combo_box_object()
             widget = post_tasks_combo_box_object(
                 item,
@@ -86,32 +141,31 @@ class SummaryDelegates(BaseAbstractItemDelegates):
                 parent=parent_widget)
             widget.setFixedHeight(source_model.NORMAL_ROW_HEIGHT)
             widget.postTasksChanged.connect(
-                lambda *x: self.commit_widget(widget=widget))
-            widget.postTasksChanged.connect(
-                lambda *x: self._commit_other_post_task_widgets(widget=widget))
+                lambda *x: self._editor_changed(widget=widget, column=c))
             widget.setFocusPolicy(Qt.NoFocus)
 
         elif c == source_model.COLUMN_OF_KOBA_SHOTSUB:
             widget = QCheckBox(parent=parent_widget)
             widget.toggled.connect(
-                lambda *x: self.commit_widget(widget=widget))
-            widget.toggled.connect(
-                lambda *x: self._commit_other_koba_shotsub_widgets(widget=widget))
+                lambda *x: self._editor_changed(widget=widget, column=c))
             widget.setFocusPolicy(Qt.NoFocus)
 
         elif c == source_model.COLUMN_OF_SUBMISSION_NOTE:
+            # Start submission note from note override, but only write if different
             note_override = item.get_note_override()
-            item.set_note_override_submission(note_override or None)
+            if item.get_note_override_submission() != (note_override or None):
+                item.set_note_override_submission(note_override or None)
 
             widget = _LineEditWithFrame(parent=parent_widget)
             # widget = QLineEdit(parent=parent_widget)
             widget.setFixedHeight(source_model.NORMAL_ROW_HEIGHT)
             line_edit = widget.get_line_edit()
+            # Seeding editor from item should not commit or propagate
+            line_edit.blockSignals(True)
             line_edit.setText(note_override or str())
-            line_edit.textChanged.connect(
-                lambda *x: self.commit_widget(widget=widget))
-            line_edit.textChanged.connect(
-                lambda *x: self._commit_other_note_widgets(widget=widget))
+            line_edit.blockSignals(False)
+            widget.textChangedDebounced.connect(
+                lambda *x: self._editor_changed(widget=widget, column=c))
 
         return widget
 
@@ -124,93 +178,73 @@ class SummaryDelegates(BaseAbstractItemDelegates):
         Args:
             widget (QtGui.QWidget):
         '''
-        if widget:
+        # NOTE: Editors changed by _propagate are committed once by that method
+        if widget and not self._propagating:
             self.commitData.emit(widget)
 
 
-    def _commit_other_post_task_widgets(self, widget=None, *args, **kwargs):
+    def _editor_changed(self, widget=None, column=None, *args, **kwargs):
         '''
-        When post task changed in any one row, then apply the state
-        to all other selected items of selection.
+        Single slot for the value changed signal of each editor, which commits
+        the editor and then propagates the value to other selected editors.
 
         Args:
-            widget (PostTasksComboBoxWidget):
+            widget (QtGui.QWidget): the editor that was changed
+            column (int): the summary model column of the editor
         '''
-        if not widget:
-            return
-        if not self._summary_model:
-            return
-        is_environment = widget.is_environment_item()
-        post_tasks = widget.get_checked_post_tasks()
-        summary_view = widget.parent().parent()
-        for qmodelindex in summary_view.selectedIndexes():
-            if not qmodelindex.isValid():
-                continue
-            qmodelindex_post_task = qmodelindex.sibling(
-                qmodelindex.row(),
-                self._summary_model.COLUMN_OF_POST_TASK)
-            _widget = summary_view.indexWidget(qmodelindex_post_task)
-            if not _widget or _widget == widget:
-                continue
-            # Must be same type
-            if _widget.is_environment_item() != is_environment:
-                continue
-            _widget.set_post_task_check_states(post_tasks)
-            self.commitData.emit(_widget)
-
-
-    def _commit_other_koba_shotsub_widgets(self, widget=None, *args, **kwargs):
+        self.commit_widget(widget=widget)
+        self._propagate(widget=widget, column=column)
+
+
+    def _propagate(self, widget=None, column=None, *args, **kwargs):
         '''
-        When Koba shotsub checkbox changed in any one row, then apply the state
-        to all other selected items of selection.
+        When editor value changed in any one row, then apply the same value
+        to the editors of all other selected items of selection.
 
         Args:
-            widget (QCheckBox):
+            widget (QtGui.QWidget): the editor that was changed
+            column (int): the summary model column of the editor
         '''
         if not widget:
             return
         if not self._summary_model:
             return
-        koba_shotsub = widget.isChecked()
-        summary_view = widget.parent().parent()
-        for qmodelindex in summary_view.selectedIndexes():
-            if not qmodelindex.isValid():
-                continue
-            qmodelindex_post_task = qmodelindex.sibling(
-                qmodelindex.row(),
-                self._summary_model.COLUMN_OF_KOBA_SHOTSUB)
-            _widget = summary_view.indexWidget(qmodelindex_post_task)
-            if not _widget or _widget == widget:
-                continue
-            _widget.setChecked(koba_shotsub)
-            self.commitData.emit(_widget)
-
-
-    def _commit_other_note_widgets(self, widget=None, *args, **kwargs):
-        '''
-        When note line edit changed in any one row, then apply the state
-        to all other selected items of selection.
-
-        Args:
-            widget (QCheckBox):
-        '''
-        if not widget:
+        # Setting the value of other editors emits their own change signals,
+        # so avoid propagating again from each of them.
+        if self._propagating:
             return
-        if not self._summary_model:
+        propagator = self._propagators.get(column)
+        if not propagator:
             return
-        submission_note = str(widget.text())
-        summary_view = widget.parent().parent()
-        for qmodelindex in summary_view.selectedIndexes():
-            if not qmodelindex.isValid():
-                continue
-            qmodelindex_note = qmodelindex.sibling(
-                qmodelindex.row(),
-                self._summary_model.COLUMN_OF_SUBMISSION_NOTE)
-            _widget = summary_view.indexWidget(qmodelindex_note)
-            if not _widget or _widget == widget:
-                continue
-            _widget.setText(submission_note)
-            self.commitData.emit(_widget)
+        get_value, set_value, match_environment = propagator
+        value = get_value(widget)
+        if match_environment:
+            is_environment = widget.is_environment_item()
+        summary_view = self._summary_view
+        if not summary_view:
+            # Editor parent is the viewport of the summary view
+            summary_view = widget.parent().parent()
+        self._propagating = True
+        try:
+            # NOTE: One index per selected row at column, rather than every selected cell
+            for qmodelindex in summary_view.selectionModel().selectedRows(column):
+                if not qmodelindex.isValid():
+                    continue
+                _widget = summary_view.indexWidget(qmodelindex)
+                if not _widget or _widget == widget:
+                    continue
+                # Must be same type
+                if match_environment and _widget.is_environment_item() != is_environment:
+                    continue
+                signals_object = self._get_editor_signals_object(_widget)
+                signals_object.blockSignals(True)
+                try:
+                    set_value(_widget, value)
+                finally:
+                    signals_object.blockSignals(False)
+                self.commitData.emit(_widget)
+        finally:
+            self._propagating = False
 
 
     def setEditorData(self, widget, qmodelindex):
@@ -225,44 +259,37 @@ class SummaryDelegates(BaseAbstractItemDelegates):
         if not qmodelindex.isValid():
            return
 
+        source_model = self._get_summary_model(qmodelindex)
         c = qmodelindex.column()
-        _qmodelindex = qmodelindex
-
-        model = qmodelindex.model()
-        source_model = model
-        if isinstance(model, QSortFilterProxyModel):
-            qmodelindex = model.mapToSource(qmodelindex)
-            source_model = model.sourceModel()
+        if c not in self._get_editor_columns(source_model):
+            QItemDelegate.setEditorData(self, widget, qmodelindex)
+            return
 
-        item = qmodelindex.internalPointer()
+        item = self._map_to_source(qmodelindex).internalPointer()
         if not item:
             return
 
-        is_environment_item = item.is_environment_item()
-        is_group_item = item.is_group_item()
-
-        if c == source_model.COLUMN_OF_VALIDATION and is_environment_item:
-            count = item.get_validation_critical_counter()
-            widget.set_validation_critical_counter(count)
-
-            count = item.get_validation_warning_counter()
-            widget.set_validation_warning_counter(count)
-
-            widget.update()
-
-        elif c == source_model.COLUMN_OF_KOBA_SHOTSUB and is_environment_item:
+        # NOTE: Item type methods are only called by the branch of the column
+        if c == source_model.COLUMN_OF_KOBA_SHOTSUB and item.is_environment_item():
             koba_shotsub = item.get_koba_shotsub()
             widget_koba_shotsub = widget.isChecked()
             koba_shotsub_changed = koba_shotsub != widget_koba_shotsub
             if koba_shotsub:
+                # Setting editor from model should not commit back to model
+                widget.blockSignals(True)
                 widget.setChecked(koba_shotsub)
+                widget.blockSignals(False)
 
-        elif c == source_model.COLUMN_OF_SUBMISSION_NOTE and not is_group_item:
+        elif c == source_model.COLUMN_OF_SUBMISSION_NOTE and not item.is_group_item():
             note_override = item.get_note_override_submission()
             widget_note_override = str(widget.text())
             note_override_changed = note_override != widget_note_override
             if note_override_changed:
-                widget.setText(note_override or str())
+                # Setting editor from model should not commit back to model
+                line_edit = widget.get_line_edit()
+                line_edit.blockSignals(True)
+                line_edit.setText(note_override or str())
+                line_edit.blockSignals(False)
 
         else:
             QItemDelegate.setEditorData(
@@ -284,31 +311,30 @@ class SummaryDelegates(BaseAbstractItemDelegates):
         if not qmodelindex.isValid():
            return
 
-        _qmodelindex = qmodelindex
-
-        model = qmodelindex.model()
-        source_model = model
-        if isinstance(model, QSortFilterProxyModel):
-            qmodelindex = model.mapToSource(qmodelindex)
-            source_model = model.sourceModel()
-
+        source_model = self._get_summary_model(qmodelindex)
         c = qmodelindex.column()
-        item = qmodelindex.internalPointer()
-        if not item:
+        if c not in self._get_editor_columns(source_model):
+            QItemDelegate.setModelData(
+                self,
+                widget,
+                abstract_item_model,
+                qmodelindex)
             return
 
-        is_environment_item = item.is_environment_item()
-        is_group_item = item.is_group_item()
+        item = self._map_to_source(qmodelindex).internalPointer()
+        if not item:
+            return
 
-        if c == source_model.COLUMN_OF_POST_TASK and not is_group_item:
+        # NOTE: Item type methods are only called by the branch of the column
+        if c == source_model.COLUMN_OF_POST_TASK and not item.is_group_item():
             post_tasks = widget.get_checked_post_tasks(update_summary=True)
             item.set_post_tasks(post_tasks)
 
-        elif c == source_model.COLUMN_OF_KOBA_SHOTSUB and is_environment_item:
+        elif c == source_model.COLUMN_OF_KOBA_SHOTSUB and item.is_environment_item():
             koba_shotsub = widget.isChecked()
             item.set_koba_shotsub(koba_shotsub)
 
-        elif c == source_model.COLUMN_OF_SUBMISSION_NOTE and not is_group_item:
+        elif c == source_model.COLUMN_OF_SUBMISSION_NOTE and not item.is_group_item():
             note_override = item.get_note_override_submission()
             widget_note_override = str(widget.text())
             note_override_changed = note_override != widget_note_override
@@ -326,6 +352,77 @@ class SummaryDelegates(BaseAbstractItemDelegates):
     ##########################################################################
 
 
+    def _get_summary_model(self, qmodelindex):
+        '''
+        Get the summary model which has the column constants, preferring the
+        summary model passed to this delegate, rather than resolving from index.
+
+        Args:
+            qmodelindex (QtCore.QModelIndex):
+
+        Returns:
+            summary_model (SummaryModel):
+        '''
+        if self._summary_model:
+            return self._summary_model
+        model = qmodelindex.model()
+        if isinstance(model, QSortFilterProxyModel):
+            return model.sourceModel()
+        return model
+
+
+    @classmethod
+    def _get_editor_columns(cls, summary_model):
+        '''
+        Get the columns of summary model which have custom editor widgets.
+
+        Args:
+            summary_model (SummaryModel):
+
+        Returns:
+            columns (tuple):
+        '''
+        return (
+            summary_model.COLUMN_OF_POST_TASK,
+            summary_model.COLUMN_OF_KOBA_SHOTSUB,
+            summary_model.COLUMN_OF_SUBMISSION_NOTE)
+
+
+    @classmethod
+    def _get_editor_signals_object(cls, widget):
+        '''
+        Get the object which emits the value changed signals of editor widget.
+
+        Args:
+            widget (QtGui.QWidget):
+
+        Returns:
+            signals_object (QtCore.QObject):
+        '''
+        if isinstance(widget, _LineEditWithFrame):
+            return widget.get_line_edit()
+        return widget
+
+
+    @classmethod
+    def _map_to_source(cls, qmodelindex):
+        '''
+        Map index to summary model index, only if index is of proxy model.
+        NOTE: Columns are the same in proxy and source model, so only map
+        when the source item is actually required.
+
+        Args:
+            qmodelindex (QtCore.QModelIndex):
+
+        Returns:
+            qmodelindex (QtCore.QModelIndex):
+        '''
+        model = qmodelindex.model()
+        if isinstance(model, QSortFilterProxyModel):
+            return model.mapToSource(qmodelindex)
+        return qmodelindex
+
+
     def get_post_tasks_combo_box_object(self):
         '''
         Get the post tasks combobox widget object in uninstantiated state.
@@ -334,23 +431,15 @@ class SummaryDelegates(BaseAbstractItemDelegates):
         Returns:
             post_tasks_combo_box (PostTasksComboBoxWidget):
         '''
-        from srnd_multi_shot_render_submitter.widgets import post_tasks_combo_box
         return post_tasks_combo_box.PostTasksComboBoxWidget
 
 
     ##########################################################################
 
 
-    # def sizeHint(self, option_style, qmodelindex):
-    #     '''
-    #     Reimplemented method.
-    #     '''
-    #     model = qmodelindex.model()
-    #     source_model = model
-    #     if isinstance(model, QSortFilterProxyModel):
-    #         qmodelindex = model.mapToSource(qmodelindex)
-    #         source_model = model.sourceModel()
-    #     return QSize(0, source_model.NORMAL_ROW_HEIGHT
+    # NOTE: sizeHint is purposefully not reimplemented (or cached) here.
+    # SummaryView uses uniform row heights, so the row height is only measured once,
+    # and column widths to fit contents still require the default text size hints.
 
 
 ##############################################################################
@@ -364,24 +453,53 @@ class _LineEditWithFrame(QFrame):
     in one note QLineEdit, and focus on the one widget without losing selection in view.
     NOTE: This behaviour was problematic because SummaryView is set to SelectRows selection
     behaviour, however some columns purposefully don't return ItemIsSelectable flag.
+    NOTE: textChangedDebounced is emitted once typing pauses (or editing finishes),
+    so each keystroke doesn't commit and propagate to the whole selection.
     '''
 
+    textChangedDebounced = Signal()
+
     def __init__(self, text=str(), parent=None):
         super(_LineEditWithFrame, self).__init__(parent=parent)
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        self.setLayout(layout)
-        self._line_edit = QLineEdit(str(text))
+        # NOTE: No layout, the line edit is simply resized to fill this frame
+        self._line_edit = QLineEdit(str(text), parent=self)
         self._line_edit.setContextMenuPolicy(Qt.NoContextMenu)
         self._line_edit.setStyleSheet('background-color: rgba(0, 0, 0, 0);')
-        layout.addWidget(self._line_edit)
         # when return is pressed ensure to clear focus on line edit
         self._line_edit.returnPressed.connect(self._line_edit.clearFocus)
 
+        self._timer_text_changed = QTimer(parent=self)
+        self._timer_text_changed.setSingleShot(True)
+        self._timer_text_changed.setInterval(NOTE_COMMIT_DELAY_MS)
+        self._timer_text_changed.timeout.connect(self._emit_text_changed_debounced)
+        self._line_edit.textChanged.connect(
+            lambda *x: self._timer_text_changed.start())
+        self._line_edit.editingFinished.connect(self._flush_text_changed)
+
+    def _emit_text_changed_debounced(self):
+        '''
+        Emit textChangedDebounced, after typing has paused.
+        '''
+        self.textChangedDebounced.emit()
+
+    def _flush_text_changed(self):
+        '''
+        Emit pending textChangedDebounced immediately, when editing finishes.
+        '''
+        if self._timer_text_changed.isActive():
+            self._timer_text_changed.stop()
+            self._emit_text_changed_debounced()
+
     def get_line_edit(self):
         return self._line_edit
 
+    def resizeEvent(self, event):
+        '''
+        Resize the line edit to fill this frame, since there is no layout.
+        '''
+        self._line_edit.setGeometry(self.rect())
+        QFrame.resizeEvent(self, event)
+
     def text(self):
         return self._line_edit.text()
 
@@ -11,7 +11,7 @@ from Qt.QtWidgets import (QApplication, QWidget, QPushButton, QCheckBox,
     QToolButton, QSlider, QMessageBox, QLabel, QMenu, QSpacerItem,
     QProgressBar, QHBoxLayout, QVBoxLayout, QSizePolicy)
 from Qt.QtGui import QFont, QIcon, QCursor, QColor
-from Qt.QtCore import Qt, QSize, Signal
+from Qt.QtCore import Qt, QSize, Signal, QTimer
 
 import srnd_qt.base.utils
 from srnd_qt.data import ui_session_data
@@ -40,6 +40,8 @@ LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
 DIALOG_WH = (1600, 950)
+# Milliseconds to wait for typing to pause before applying search text
+SEARCH_DELAY_MS = 150
 BASE_WINDOW_STYLESHEET = base_window.DEFAULT_BASE_WINDOW_STYLESHEET
 
 STYLESHEET_BORDER = '''
@@ -171,6 +173,13 @@ class MultiShotSubmitterWindow(base_window.BaseWindow):
         self._columns_widths_cached = None
         self._debug_mode = bool(debug_mode)
 
+        # Search state
+        self._search_text_pending = None
+        self._timer_search = QTimer(parent=self)
+        self._timer_search.setSingleShot(True)
+        self._timer_search.setInterval(SEARCH_DELAY_MS)
+        self._timer_search.timeout.connect(self._search_view_by_pending_text)
+
         # Session state
         self._session_auto_save_on_timer = True
         self._session_auto_save_duration = 180
@@ -474,7 +483,7 @@ class MultiShotSubmitterWindow(base_window.BaseWindow):
 
         # Menu bar signals
         search_widget = self.get_menu_bar_header_widget().get_search_widget()
-        search_widget.searchRequest.connect(self.search_view_by_filters)
+        search_widget.searchRequest.connect(self.search_view_by_filters_delayed)
         search_filter_widget = self.get_menu_bar_header_widget().get_search_filter_widget()
         search_filter_widget.applySearchFiltersRequest.connect(self.search_view_by_filters)
         search_filter_widget.logMessage.connect(self.add_log_message)
@@ -1368,6 +1377,10 @@ class MultiShotSubmitterWindow(base_window.BaseWindow):
         Returns:
             count (int): number of rows or columns toggled visible state
         '''
+        # Any pending delayed search is superseded by this search
+        self._timer_search.stop()
+        self._search_text_pending = None
+
         search_filter_widget = self.get_menu_bar_header_widget().get_search_filter_widget()
         search_filters = dict()
         if self._show_advanced_search:
@@ -1385,6 +1398,25 @@ class MultiShotSubmitterWindow(base_window.BaseWindow):
         return count
 
 
+    def search_view_by_filters_delayed(self, search_text=None):
+        '''
+        Search using the current search text once the user pauses typing,
+        so a burst of search requests only searches the view once.
+
+        Args:
+            search_text (str): the value in current search widget to filter
+        '''
+        self._search_text_pending = search_text
+        self._timer_search.start()
+
+
+    def _search_view_by_pending_text(self):
+        '''
+        Search using the last search text requested by search_view_by_filters_delayed.
+        '''
+        self.search_view_by_filters(self._search_text_pending)
+
+
     def search_reset(self):
         '''
         reset the search widget to default state.
@@ -2064,7 +2096,7 @@ class MultiShotSubmitterWindow(base_window.BaseWindow):
             icon = QIcon(os.path.join(SRND_QT_ICONS_DIR, 'select_all_s01.png'))
             menu_select_by_selection_set.setIcon(icon)
             menu.addMenu(menu_select_by_selection_set)
-            for selection_set_name in self._tree_view.get_item_selection_sets_names():
+            for selection_set_name in selection_sets_names:
                 action = srnd_qt.base.utils.context_menu_add_menu_item(
                     self,
                     selection_set_name)
@@ -678,6 +678,7 @@ class SummaryAndValidationWindow(base_window.BaseWindow):
         self._summary_delegates = _summary_delegates_object(
             debug_mode=self._debug_mode,
             summary_model=self._summary_model,
+            summary_view=self._summary_view,
             parent=self)
         self._summary_view.setItemDelegate(self._summary_delegates)
 
@@ -906,8 +907,8 @@ class SummaryAndValidationWindow(base_window.BaseWindow):
                 self._cached_env_qmodelindices[oz_area] = {
                     'validation_qmodelindex':
                     validation_qmodelindex}
+                # NOTE: Validation hints are painted by delegate, so dont require editor
                 for column in [
-                        self._summary_model.COLUMN_OF_VALIDATION,
                         self._summary_model.COLUMN_OF_POST_TASK,
                         self._summary_model.COLUMN_OF_KOBA_SHOTSUB,
                         self._summary_model.COLUMN_OF_SUBMISSION_NOTE]:
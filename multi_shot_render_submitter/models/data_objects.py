@@ -604,8 +604,9 @@ class RenderItem(BaseMultiShotItem):
         if node_name != item_full_name:
             check_values.append(item_full_name)
 
+        # NOTE: re caches compiled patterns, and search stops at the first match
         for check_value in check_values:
-            result = re.findall(search_text, check_value, flags=re.IGNORECASE)
+            result = re.search(search_text, check_value, flags=re.IGNORECASE)
             if result:
                 return True
 
@@ -1493,7 +1494,7 @@ class OverrideBaseItem(BaseMultiShotItem):
 
         note_override = self.get_note_override()
         if note_override:
-            found = re.findall(search_text, note_override)
+            found = re.search(search_text, note_override)
             if found:
                 return True
 
@@ -4347,11 +4348,11 @@ class EnvironmentItem(OverrideBaseItem):
         Returns:
             found (bool):
         '''
-        found = re.findall(search_text, self.get_oz_area(), flags=re.IGNORECASE)
+        found = re.search(search_text, self.get_oz_area(), flags=re.IGNORECASE)
         if found:
             return True
 
-        found = re.findall(search_text, self.get_environment_name_nice())
+        found = re.search(search_text, self.get_environment_name_nice())
         if found:
             return True
 
@@ -4362,9 +4363,9 @@ class EnvironmentItem(OverrideBaseItem):
         if has_environment_token:#and any([oz_area, job_identifier]):
             _oz_area = search_text.split(':')[-1]
             if _oz_area:
-                found = re.findall(_oz_area, self.get_oz_area(), flags=re.IGNORECASE)
+                found = re.search(_oz_area, self.get_oz_area(), flags=re.IGNORECASE)
                 if not found:
-                    found = re.findall(_oz_area, self.get_environment_name_nice())
+                    found = re.search(_oz_area, self.get_environment_name_nice())
                 if found:
                     return True
             else:
@@ -4377,7 +4378,7 @@ class EnvironmentItem(OverrideBaseItem):
         if has_job_identifier_token and job_identifier:
             _job_identifier = search_text.split(':')[-1]
             if _job_identifier:
-                found = re.findall(_job_identifier, job_identifier, flags=re.IGNORECASE)
+                found = re.search(_job_identifier, job_identifier, flags=re.IGNORECASE)
                 if found:
                     return True
             else:
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 
+import contextlib
 import copy
 import collections
 import datetime
@@ -13,7 +14,7 @@ import time
 import traceback
 
 from Qt.QtGui import QFont, QIcon
-from Qt.QtCore import (Qt, QModelIndex, QSize, Signal)
+from Qt.QtCore import (Qt, QModelIndex, QPersistentModelIndex, QSize, Signal)
 
 from srnd_qt.ui_framework.models import base_abstract_item_model
 
@@ -184,6 +185,35 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
         self._in_wait_on_interactive_mode = False
         self._is_submitting_in_dispatcher_task = False
 
+        # Cached lookups of environment QPersistentModelIndex (column 0 only),
+        # by UUID and by identifier. Rebuilt by _update_environments_indices.
+        self._uuid_to_index = dict()
+        self._identifier_to_indices = dict()
+        # Cached lookups of pass for env UUID and identifier to environment
+        # UUID and column. Only built when a pass for env key is first looked up.
+        self._pass_uuid_to_env_column = None
+        self._pass_identifier_to_env_columns = None
+        # Depth of nested batched model updates, and whether cached
+        # environments indices update was deferred until the batch ends.
+        self._bulk_update_depth = 0
+        self._indices_dirty = False
+        # Header fonts by pixel size and weight, constructed once
+        self._header_fonts_cache = dict()
+        # Cached environment items indices at root or in group, cleared on any change of rows
+        self._environment_items_indices_cache = None
+        for signal in (
+                self.rowsAboutToBeInserted,
+                self.rowsInserted,
+                self.rowsAboutToBeRemoved,
+                self.rowsRemoved,
+                self.rowsAboutToBeMoved,
+                self.rowsMoved,
+                self.layoutAboutToBeChanged,
+                self.layoutChanged,
+                self.modelAboutToBeReset,
+                self.modelReset):
+            signal.connect(self._clear_environment_items_indices_cache)
+
         # Setup root abstract data node
         root_node = data_objects.RootMultiShotItem(
             version_global_system=constants.DEFAULT_CG_VERSION_SYSTEM,
@@ -209,6 +239,10 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
 
         # Other signal setup
         self.framesResolveRequest.connect(self.resolve_frames_for_index)
+        # Columns of render items changed, so pass for env lookups must be rebuilt
+        self.columnsInserted.connect(self._clear_pass_for_env_lookups)
+        self.columnsRemoved.connect(self._clear_pass_for_env_lookups)
+        self.modelReset.connect(self._clear_pass_for_env_lookups)
 
         # Route all messages to shell when in dispatching mode.
         if not self.get_in_host_app_ui():
@@ -971,12 +1005,39 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
                     return qmodelindex_pass
 
 
+    @contextlib.contextmanager
+    def _batched_model_updates(self):
+        '''
+        Context manager to defer updating the cached environments indices until the
+        outermost batch of model operations exits.
+        Note: If any update was deferred, updateOverviewRequested is emitted once on exit.
+        '''
+        self._bulk_update_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_update_depth -= 1
+            if not self._bulk_update_depth and self._indices_dirty:
+                self._indices_dirty = False
+                self._update_environments_indices()
+                self.updateOverviewRequested.emit()
+
+
     def _update_environments_indices(self):
         '''
         Update the cached environments indices.
+        Also rebuild the cached UUID and identifier to environment QPersistentModelIndex lookups.
+        Note: When called during batched model updates, this is deferred until the batch ends.
+        Note: Pass for env lookups are only rebuilt when next required.
         '''
+        if self._bulk_update_depth:
+            self._indices_dirty = True
+            return
         environments_counter = dict()
-        for i, environment_item in enumerate(self.get_environment_items()):
+        uuid_to_index = dict()
+        identifier_to_indices = dict()
+        for qmodelindex_env in self.get_environment_items_indices():
+            environment_item = qmodelindex_env.internalPointer()
             environment = environment_item.get_oz_area()
             if environment not in environments_counter.keys():
                 environments_counter[environment] = 0
@@ -984,6 +1045,173 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
             index = environments_counter[environment]
             environment_item._set_cached_environment_index(index)
 
+            qpersistentmodelindex = QPersistentModelIndex(qmodelindex_env)
+            uuid_to_index[environment_item.get_identity_id()] = qpersistentmodelindex
+            # NOTE: Environment can be matched by nice name or by area
+            identifiers = set([
+                environment_item.get_environment_name_nice(),
+                environment])
+            for identifier in identifiers:
+                identifier_to_indices.setdefault(identifier, list()).append(
+                    qpersistentmodelindex)
+
+        self._uuid_to_index = uuid_to_index
+        self._identifier_to_indices = identifier_to_indices
+        self._clear_pass_for_env_lookups()
+
+
+    def _clear_pass_for_env_lookups(self, *args):
+        '''
+        Clear the cached pass for env lookups, so they are rebuilt when next required.
+        '''
+        self._pass_uuid_to_env_column = None
+        self._pass_identifier_to_env_columns = None
+
+
+    def _get_pass_for_env_lookups(self):
+        '''
+        Get the cached pass for env UUID and identifier lookups, building them if required.
+        NOTE: Values are environment UUID and column, rather than QPersistentModelIndex,
+        so Qt doesnt need to update an index for every pass for env on structural changes.
+
+        Returns:
+            pass_uuid_to_env_column, pass_identifier_to_env_columns (tuple):
+        '''
+        if self._pass_uuid_to_env_column is None:
+            column_count = self.columnCount(QModelIndex())
+            pass_uuid_to_env_column = dict()
+            pass_identifier_to_env_columns = dict()
+            for qmodelindex_env in self.get_environment_items_indices():
+                environment_identity_id = qmodelindex_env.internalPointer().get_identity_id()
+                row = qmodelindex_env.row()
+                for c in range(1, column_count):
+                    qmodelindex_pass = qmodelindex_env.sibling(row, c)
+                    if not qmodelindex_pass.isValid():
+                        continue
+                    pass_env_item = qmodelindex_pass.internalPointer()
+                    env_column = (environment_identity_id, c)
+                    pass_uuid_to_env_column[pass_env_item.get_identity_id()] = env_column
+                    identifier = pass_env_item.get_identifier(nice_env_name=True)
+                    pass_identifier_to_env_columns.setdefault(identifier, list()).append(
+                        env_column)
+            self._pass_uuid_to_env_column = pass_uuid_to_env_column
+            self._pass_identifier_to_env_columns = pass_identifier_to_env_columns
+        return self._pass_uuid_to_env_column, self._pass_identifier_to_env_columns
+
+
+    def _is_cached_index_for_key(self, qmodelindex, key, by_uuid=True):
+        '''
+        Check an index from cached lookups is still valid and still matches the UUID or identifier key.
+
+        Args:
+            qmodelindex (QModelIndex):
+            key (str): UUID or identifier
+            by_uuid (bool): whether the key is a UUID, otherwise an identifier
+
+        Returns:
+            is_current (bool):
+        '''
+        if not qmodelindex.isValid():
+            return False
+        item = qmodelindex.internalPointer()
+        if by_uuid:
+            return item.get_identity_id() == key
+        if item.is_environment_item():
+            return key in (item.get_environment_name_nice(), item.get_oz_area())
+        return item.get_identifier(nice_env_name=True) == key
+
+
+    def _get_cached_indices_for_key(self, key, by_uuid=True):
+        '''
+        Get the environment or pass for env QModelIndex for UUID or identifier from cached lookups.
+
+        Args:
+            key (str): UUID or identifier
+            by_uuid (bool): whether the key is a UUID, otherwise an identifier
+
+        Returns:
+            qmodelindices, is_stale (tuple): matching indices, and whether any cached
+                entry for key no longer matches (so the lookups should be rebuilt)
+        '''
+        if by_uuid:
+            qpersistentmodelindex = self._uuid_to_index.get(key)
+            qpersistentmodelindices = list()
+            if qpersistentmodelindex is not None:
+                qpersistentmodelindices.append(qpersistentmodelindex)
+        else:
+            qpersistentmodelindices = self._identifier_to_indices.get(key, list())
+        qmodelindices = [QModelIndex(index) for index in qpersistentmodelindices]
+
+        is_stale = False
+        if not qmodelindices:
+            pass_uuid_to_env_column, pass_identifier_to_env_columns = \
+                self._get_pass_for_env_lookups()
+            if by_uuid:
+                env_column = pass_uuid_to_env_column.get(key)
+                env_columns = [env_column] if env_column else list()
+            else:
+                env_columns = pass_identifier_to_env_columns.get(key, list())
+            for environment_identity_id, column in env_columns:
+                qpersistentmodelindex_env = self._uuid_to_index.get(environment_identity_id)
+                if qpersistentmodelindex_env is None or not qpersistentmodelindex_env.isValid():
+                    is_stale = True
+                    continue
+                qmodelindex_env = QModelIndex(qpersistentmodelindex_env)
+                qmodelindices.append(qmodelindex_env.sibling(qmodelindex_env.row(), column))
+
+        qmodelindices_current = list()
+        for qmodelindex in qmodelindices:
+            if not self._is_cached_index_for_key(qmodelindex, key, by_uuid=by_uuid):
+                is_stale = True
+                continue
+            qmodelindices_current.append(qmodelindex)
+        return qmodelindices_current, is_stale
+
+
+    def get_indices_by_uuids_or_identifiers(self, uuids=None, identifiers=None):
+        '''
+        Get the environment and pass for env QModelIndex for UUIDs and / or identifiers,
+        using the cached lookups (rather than traversing all indices).
+        Note: If any cached entry is stale the cached lookups are rebuilt once.
+        Keys which are simply unknown dont cause a rebuild.
+
+        Args:
+            uuids (list): list of UUIDs
+            identifiers (list): list of identifiers
+
+        Returns:
+            qmodelindices (list): list of unique QModelIndex, environment indices first
+        '''
+        # Remove duplicate keys (keeping order), so each is only looked up once
+        uuids = collections.OrderedDict.fromkeys(uuids or list()).keys()
+        identifiers = collections.OrderedDict.fromkeys(identifiers or list()).keys()
+        for attempt in range(2):
+            is_stale = False
+            qmodelindices = list()
+            for keys, by_uuid in ((uuids, True), (identifiers, False)):
+                for key in keys:
+                    _qmodelindices, _is_stale = self._get_cached_indices_for_key(
+                        key,
+                        by_uuid=by_uuid)
+                    qmodelindices.extend(_qmodelindices)
+                    is_stale = is_stale or _is_stale
+            if not is_stale or attempt:
+                break
+            self._update_environments_indices()
+
+        environment_indices, pass_env_indices = list(), list()
+        visited = set()
+        for qmodelindex in qmodelindices:
+            item = qmodelindex.internalPointer()
+            if item in visited:
+                continue
+            visited.add(item)
+            if item.is_environment_item():
+                environment_indices.append(qmodelindex)
+            else:
+                pass_env_indices.append(qmodelindex)
+        return environment_indices + pass_env_indices
+
 
     def get_item_environment(self, item, show_full_environments=None):
         '''
@@ -1018,6 +1246,7 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
         '''
         Get list of main model EnvironmentItem indices.
         Note: EnvironmentItem can only currently be at root of data model or under a group.
+        Note: Only valid indices of EnvironmentItem are returned, so callers dont need to skip group items.
 
         Args:
             parent_index (QModelIndex): optionally only get environment item indices below this QModelIndex
@@ -1027,6 +1256,10 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
             environment_items_indices (list):
         '''
         parent_index = parent_index or QModelIndex()
+        # Only the default traversal of the whole model is cached
+        use_cache = not parent_index.isValid() and depth_limit == 2
+        if use_cache and self._environment_items_indices_cache is not None:
+            return list(self._environment_items_indices_cache)
         row_count = self.rowCount(parent_index)
         environment_items_indices = list()
         for row in range(row_count):
@@ -1047,9 +1280,18 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
                     item_depth2 = qmodelindex_depth2.internalPointer()
                     if item_depth2.is_environment_item():
                         environment_items_indices.append(qmodelindex_depth2)
+        if use_cache:
+            self._environment_items_indices_cache = tuple(environment_items_indices)
         return environment_items_indices
 
 
+    def _clear_environment_items_indices_cache(self, *args):
+        '''
+        Clear the cached environment items indices, because rows of model have changed.
+        '''
+        self._environment_items_indices_cache = None
+
+
     def add_environment(
             self,
             oz_area=None,
@@ -8475,37 +8717,46 @@ class MultiShotRenderModel(base_abstract_item_model.BaseAbstractItemModel):
                 return msg
 
         elif role == Qt.FontRole:
-            font = QFont()
-            font.setFamily(constants.FONT_FAMILY)
             if section == 0:
-                font.setPixelSize(11)
-                font.setBold(True)
-            else:
-                qmodelindex = self.index(0, section, QModelIndex())
-                try:
-                    render_item = self.get_render_items()[section - 1]
-                except:
-                    render_item = None
-                if render_item and render_item._cached_width:
-                    if render_item._cached_width <= 60:
-                        width = 8
-                    elif render_item._cached_width <= 90:
-                        width = 9
-                    elif render_item._cached_width <= 200:
-                        width = 10
-                        font.setBold(True)
-                    elif render_item._cached_width <= 300:
-                        width = 11
-                        font.setBold(True)
-                    else:
-                        width = 12
-                        font.setBold(True)
-                    font.setPixelSize(width)
-                else:
-                    font.setPixelSize(11)
-                    font.setBold(True)
+                return self._get_header_font(11, bold=True)
+            try:
+                render_item = self.get_render_items()[section - 1]
+            except:
+                render_item = None
+            if render_item and render_item._cached_width:
+                if render_item._cached_width <= 60:
+                    return self._get_header_font(8)
+                elif render_item._cached_width <= 90:
+                    return self._get_header_font(9)
+                elif render_item._cached_width <= 200:
+                    return self._get_header_font(10, bold=True)
+                elif render_item._cached_width <= 300:
+                    return self._get_header_font(11, bold=True)
+                return self._get_header_font(12, bold=True)
+            return self._get_header_font(11, bold=True)
+
+
+    def _get_header_font(self, pixel_size, bold=False):
+        '''
+        Get a header QFont of pixel size and weight.
+        Note: Fonts are cached, since header data is requested on every header paint.
+
+        Args:
+            pixel_size (int):
+            bold (bool):
 
-            return font
+        Returns:
+            font (QFont):
+        '''
+        key = (pixel_size, bold)
+        font = self._header_fonts_cache.get(key)
+        if font is None:
+            font = QFont()
+            font.setFamily(constants.FONT_FAMILY)
+            font.setPixelSize(pixel_size)
+            font.setBold(bold)
+            self._header_fonts_cache[key] = font
+        return font
 
 
     def setData(self, qmodelindex, value, role=Qt.EditRole):
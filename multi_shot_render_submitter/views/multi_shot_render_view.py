@@ -1,10 +1,13 @@
 
 
 import collections
+import contextlib
 import fileseq
 import functools
 import logging
 import os
+import re
+import sys
 import time
 import traceback
 
@@ -14,9 +17,11 @@ from Qt.QtGui import (QCursor, QIcon, QPixmap, QColor, QPen,
     QFont, QFontMetrics, QPainter, QRegExpValidator, QMovie)
 from Qt.QtCore import (Qt, QModelIndex, Signal, QSize, QRect,
     QPoint, QItemSelection, QItemSelectionModel, 
-    QItemSelectionRange, QRegExp)
+    QItemSelectionRange, QRegExp, QTimer)
 
 import srnd_qt.base.utils
+from srnd_qt.ui_framework.dialogs import input_dialog
+from srnd_qt.ui_framework.validators import element_name_validator
 from srnd_qt.ui_framework.views import base_tree_view
 from srnd_qt.ui_framework.widgets import searchable_menu
 
@@ -38,6 +43,19 @@ MULTI_SHOT_ICON_PATH = os.path.join(
     ICONS_DIR,
     'Multi_Shot_Render_Submitter_logo_01_128x128.png')
 
+# Plain dict preserves insertion order (and is reversible) from Python 3.8 and is lighter than OrderedDict
+INSERTION_ORDERED_DICT = dict if sys.version_info >= (3, 8) else collections.OrderedDict
+
+# Search filter prefixes for environment items and pass for env items
+SEARCH_ENV_FILTERS_MODIFIERS = ('env:', 'area:', 'environment:', 'shot:', 'job:')
+SEARCH_PASS_FILTERS_MODIFIERS = ('pass:',)
+SEARCH_FRAME_NOTE_FILTERS_MODIFIERS = ('frame:', 'frames:', 'note:', 'notes:')
+
+# Split text of dropped mime data on line break or comma
+MIME_TEXT_SPLIT_REGEX = re.compile('[\n,]')
+
+DIALOG_HEADER_STYLE_SHEET = 'QGroupBox {background: rgb(70, 70, 70);border:rgb(70, 70, 70)}'
+
 fs = '<b><font color="#33CC33">'
 fe = '</b></font>'
 
@@ -64,6 +82,8 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
     draggingComplete = Signal()
     resetColumnWidthsRequest = Signal()
 
+    SET_NAME_REGEXP = QRegExp('[A-Za-z0-9_ ]+')
+
     def __init__(
             self,
             icon_path=MULTI_SHOT_ICON_PATH,
@@ -76,6 +96,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         self.ORGANIZATION_NAME = 'Weta_Digital'
         self.HOST_APP_RENDERABLES_LABEL = constants.HOST_APP_RENDERABLES_LABEL
         self.HOST_APP_ICON = icon_path
+        self.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER = constants.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER
 
         self.NORMAL_ROW_HEIGHT = NORMAL_ROW_HEIGHT
         self.COLUMN_0_WIDTH = 240
@@ -91,6 +112,19 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         self._item_selection_sets = collections.OrderedDict()
         self._pass_visibility_sets = collections.OrderedDict()
+        self._set_name_validator = None
+        # Persistent editor widgets of environment and pass for env cells, by index internal id
+        self._cell_widgets = dict()
+        # Single shot timer to update overlays once control returns to the event loop.
+        # NOTE: Parented to this view, so it never fires after the view is destroyed.
+        self._timer_overlay_update = QTimer(parent=self)
+        self._timer_overlay_update.setSingleShot(True)
+        self._timer_overlay_update.setInterval(0)
+        self._timer_overlay_update.timeout.connect(self._flush_overlay_update)
+        # Organized source indices of current drag and drop operation, gathered once per drag
+        self._drag_source_cache = None
+        # Mime text of current drag, and the kind and payload it was classified as
+        self._mime_classification_cache = None
 
         self._copied_overrides_dict = dict()
         self._copied_pass_overrides_dict = dict()
@@ -249,7 +283,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             self.resize_environment_column_to_optimal()
 
         if self._overlay_widget:
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
         # Refresh the preferences file to keep in sync
         if value != current_value:
@@ -1106,7 +1140,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         if self._overlay_widget:
             self._overlay_widget.set_active(True)
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
 
     # def apply_row_visibility_data(
@@ -1342,6 +1376,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                     continue
                 identifier = item.get_environment_name_nice()
             else:
+                # NOTE: Use the data object method, since the models identifier lookups are keyed on it
                 identifier = item.get_identifier(nice_env_name=True)
             identifiers.append(identifier)
         return identifiers
@@ -1423,7 +1458,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 action.triggered.connect(method_to_call)
                 menu.addAction(action)
 
-            if constants.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER and header.get_draw_header_disabled_hint():
+            if self.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER and header.get_draw_header_disabled_hint():
                 action = srnd_qt.base.utils.context_menu_add_menu_item(
                     menu,
                     'Toggle enabled')
@@ -3066,7 +3101,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 if not qmodelindex.isValid():
                     continue
                 item = qmodelindex.internalPointer()
-                if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
+                if not (item.is_environment_item() or item.is_pass_for_env_item()):
                     continue
                 render_overrides_items = item.get_render_overrides_items()
                 if override_id not in render_overrides_items.keys():
@@ -3105,7 +3140,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             item = qmodelindex.internalPointer()
             # Can only apply render overrides item to these types
-            if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
+            if not (item.is_environment_item() or item.is_pass_for_env_item()):
                 continue
             identifier = item.get_identifier()
 
@@ -3164,7 +3199,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             item = qmodelindex.internalPointer()
             # Can only remove render overrides from these item types
-            if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
+            if not (item.is_environment_item() or item.is_pass_for_env_item()):
                 continue
             identifier = item.get_identifier()
 
@@ -3209,7 +3244,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             item = qmodelindex.internalPointer()
             # Can only copy render overrides from these item types
-            if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
+            if not (item.is_environment_item() or item.is_pass_for_env_item()):
                 continue
             identifier = item.get_identifier()
 
@@ -3260,7 +3295,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             item = qmodelindex.internalPointer()
             # Can only remove render overrides item to these types
-            if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
+            if not (item.is_environment_item() or item.is_pass_for_env_item()):
                 continue
 
             _removed_count = item.remove_all_render_override_items()
@@ -3294,7 +3329,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             item = qmodelindex.internalPointer()
             # Can only validate render overrides item to these types
-            if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
+            if not (item.is_environment_item() or item.is_pass_for_env_item()):
                 continue
             _changed_count = item.validate_render_overrides()
             if _changed_count:
@@ -3425,7 +3460,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                     continue
                 item = _qmodelindex.internalPointer()
                 # NOTE: Only specified item types supported for this expanded menu
-                if any([item.is_pass_for_env_item(), item.is_environment_item()]):
+                if item.is_pass_for_env_item() or item.is_environment_item():
                     qmodelindex = _qmodelindex
                     break
 
@@ -3482,7 +3517,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             removed_count = model.clear_render_items(columns=[column])
 
             if self._overlay_widget:
-                self._overlay_widget.update_overlays()
+                self._schedule_overlay_update()
 
             # Update the overview
             model.updateOverviewRequested.emit()
@@ -3495,7 +3530,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         elif operation == 'Rename Node':
             msg = '{}{}{}'.format(fs, node_name, fe)
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose new name for pass: {}'.format(msg),
                 input_type_required=str(),
@@ -3506,9 +3540,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 150)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
             result = dialog.exec_()
 
             if result == QDialog.Accepted and dialog.get_result():
@@ -3682,7 +3714,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             msg = '<i>Choose explicit cg version number. '
             msg += 'Can be future version that doesn\'t yet exist.</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose {}custom cg version{}'.format(fs, fe),
                 description=msg,
@@ -3697,9 +3728,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 20)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             result = dialog.exec_()
             if result == QDialog.Rejected:
@@ -3748,7 +3777,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
             msg = '<i>This NOT frames will be taken away from resolved frames.</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose frames to {}NOT{} render'.format(fs, fe),
                 description=msg,
@@ -3761,9 +3789,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 200)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
             from srnd_qt.ui_framework.validators import frames_validator
@@ -3826,7 +3852,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 msg += '<br>This NOT frames will be taken away from resolved frames.</i>'
                 window_title = 'Choose to NOT render every nth frame'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str=title_str,
                 description=msg,
@@ -3842,9 +3867,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 175)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
             result = dialog.exec_()
@@ -4117,7 +4140,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 wait_on_plow_ids = scheduler_operations.validate_plow_ids(
                     current_wait_on_plow_ids)
                 wait_on_plow_ids_changed = wait_on_plow_ids != current_wait_on_plow_ids
-                if any([wait_on_changed, wait_on_plow_ids_changed]):
+                if wait_on_changed or wait_on_plow_ids_changed:
                     model.dataChanged.emit(qmodelindex, qmodelindex)
                 continue
 
@@ -4738,7 +4761,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 item.set_wait_on_plow_ids(_wait_on_plow_ids_list)
                 wait_on_plow_ids_changed = _wait_on_plow_ids_list != current_wait_on_plow_ids
                 update_count += int(wait_on_changed)
-                if any([wait_on_changed, wait_on_plow_ids_changed]):
+                if wait_on_changed or wait_on_plow_ids_changed:
                     model.dataChanged.emit(qmodelindex, qmodelindex)
                 continue
 
@@ -4798,7 +4821,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             model.updateOverviewRequested.emit()
         self.setFocus(Qt.ShortcutFocusReason)
         if override_id == constants.OVERRIDE_WAIT and self._overlay_widget:
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
         return update_count
 
 
@@ -4942,7 +4965,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             msg = '<i>Job identifier will become part of job name at submission.</i>'
             msg += '<br><i>Note: Use camelCase or underscore as spaces not permitted.</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose {}job identifier{}'.format(fs, fe),
                 description=msg,
@@ -4955,9 +4977,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 175)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
             validator = QRegExpValidator()
@@ -5046,7 +5066,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             msg = '<i>Notes are used for Shotsub or Koba tasks '
             msg += 'or just to help organize the session.</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str=title_str,
                 description=msg,
@@ -5059,9 +5078,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(725, 175)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
             result = dialog.exec_()
@@ -5632,17 +5649,15 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         organized_indices, selection_count = self.get_selected_organized_environment_indices()
 
-        delete_item_ids = set()
+        deleted_count = 0
 
         # Filter selection for deletable items
         envs_to_delete, groups_to_delete = 0, 0
         for parent_item_id in organized_indices.keys():
-            rows = reversed(sorted(organized_indices[parent_item_id].keys()))
+            rows = sorted(organized_indices[parent_item_id], reverse=True)
             for row in rows:
                 source_qmodelindex = organized_indices[parent_item_id][row]
                 item = source_qmodelindex.internalPointer()
-                if source_qmodelindex.column() != 0:
-                    continue
                 if item.is_environment_item():
                     envs_to_delete += 1
                 elif item.is_group_item():
@@ -5677,126 +5692,134 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         model = self.model()
 
-        # Block the selection model selectionChanged signals from possibly
-        # updating the details panel via the updateDetailsPanel signal.
-        selection_model = self.selectionModel()
-        selection_model.blockSignals(True)
-
-        progress_msg = 'Selection count to consider for delete: {}'.format(selection_count)
-        self.logMessage.emit(progress_msg, logging.WARNING)
+        # Defer cached environments indices update and overview until all items are deleted
+        with model._batched_model_updates():
+            # Block the selection model selectionChanged signals from possibly
+            # updating the details panel via the updateDetailsPanel signal.
+            selection_model = self.selectionModel()
+            selection_model.blockSignals(True)
+
+            progress_msg = 'Selection count to consider for delete: {}'.format(selection_count)
+            self.logMessage.emit(progress_msg, logging.WARNING)
+
+            # Show progress bar
+            model.toggleProgressBarVisible.emit(True)
+            model.updateLoadingBarFormat.emit(0, progress_msg + ' - %p%')
+
+            # On first pass delete all selected environment item
+            i = 0
+            last_percent = None
+            items_removed = list()
+            columns_to_update = set()
+            render_item_columns = dict()
+            if envs_to_delete:
+                for c, render_item in enumerate(model.get_render_items()):
+                    render_item_columns[render_item] = c + 1
+            for parent_item_id in organized_indices.keys():
+                rows = sorted(organized_indices[parent_item_id], reverse=True)
+                for row in rows:
+                    source_qmodelindex = organized_indices[parent_item_id][row]
+                    item = source_qmodelindex.internalPointer()
+                    if not item.is_environment_item():
+                        continue
+                    row = source_qmodelindex.row()
 
-        # Show progress bar
-        model.toggleProgressBarVisible.emit(True)
-        model.updateLoadingBarFormat.emit(0, progress_msg + ' - %p%')
+                    percent = int((float(i) / selection_count) * 100)
+                    msg = 'Performing delete'
 
-        # On first pass delete all selected environment item
-        i = 0
-        items_removed = list()
-        for parent_item_id in organized_indices.keys():
-            rows = reversed(sorted(organized_indices[parent_item_id].keys()))
-            for row in rows:
-                source_qmodelindex = organized_indices[parent_item_id][row]
-                if not source_qmodelindex.isValid():
-                    continue
-                if source_qmodelindex.column() != 0:
-                    continue
-                item = source_qmodelindex.internalPointer()
-                if not item.is_environment_item():
-                    continue
-                row = source_qmodelindex.row()
+                    # Update loading bar, only when percent changes to limit repaints
+                    self.logMessage.emit(msg, logging.INFO)
+                    if percent != last_percent:
+                        self.updateLoadingBarFormat.emit(percent, msg + ' - %p%')
+                        last_percent = percent
 
-                percent = int((float(i) / selection_count) * 100)
-                msg = 'Performing delete'
+                    oz_area = item.get_oz_area()
+                    items_removed.append(oz_area)
 
-                # Update loading bar
-                self.logMessage.emit(msg, logging.INFO)
-                self.updateLoadingBarFormat.emit(percent, msg + ' - %p%')
+                    msg = 'Deleting environment: "{}". '.format(oz_area)
+                    msg += 'Row: "{}"'.format(row)
+                    self.logMessage.emit(msg, logging.WARNING)
+                    # Update the total renderable count for every column where this
+                    # environment item sibling items render pass for items was
+                    # contributing to renderable count.
+                    for pass_for_env_item in item.get_pass_for_env_items():
+                        if not pass_for_env_item.get_active():
+                            continue
+                        render_item = pass_for_env_item.get_source_render_item()
+                        render_item._renderable_count_for_render_node -= 1
+                        if render_item._renderable_count_for_render_node < 0:
+                            render_item._renderable_count_for_render_node = 0
+                        column = render_item_columns.get(render_item)
+                        if column is not None:
+                            columns_to_update.add(column)
+                    columns_to_update.add(0)
+
+                    deleted_count += 1
+
+                    parent_item = item.parent()
+                    model.beginRemoveRows(source_qmodelindex.parent(), row, row)
+                    if parent_item:
+                        parent_item.remove_child(row)
+                    model.endRemoveRows()
 
-                oz_area = item.get_oz_area()
-                items_removed.append(oz_area)
+                    i += 1
 
-                msg = 'Deleting environment: "{}". '.format(oz_area)
-                msg += 'Row: "{}"'.format(row)
-                self.logMessage.emit(msg, logging.WARNING)
-                # Update the total renderable count for every column where this
-                # environment item sibling items render pass for items was
-                # contributing to renderable count.
-                for pass_for_env_item in item.get_pass_for_env_items():
-                    if not pass_for_env_item.get_active():
+            # On second pass delete all selected group item
+            organized_indices, selection_count = self.get_selected_organized_environment_indices()
+            for parent_item_id in organized_indices.keys():
+                rows = sorted(organized_indices[parent_item_id], reverse=True)
+                for row in rows:
+                    source_qmodelindex = organized_indices[parent_item_id][row]
+                    item = source_qmodelindex.internalPointer()
+                    if not item.is_group_item():
                         continue
-                    render_item = pass_for_env_item.get_source_render_item()
-                    render_item._renderable_count_for_render_node -= 1
-                    if render_item._renderable_count_for_render_node < 0:
-                        render_item._renderable_count_for_render_node = 0
-
-                delete_item_ids.add(id(item))
+                    row = source_qmodelindex.row()
+
+                    # Remove Groups children first
+                    _children = list(item.children())
+                    _row_count = len(_children)
+                    if _row_count:
+                        model.beginRemoveRows(source_qmodelindex, 0, _row_count)
+                        for _child in _children:
+                            msg = ' - Deleting environment: "{}". '.format(_child.get_oz_area())
+                            self.logMessage.emit(msg, logging.WARNING)
+                            item.remove_child(0)
+                        model.endRemoveRows()
 
-                parent_item = item.parent()
-                model.beginRemoveRows(source_qmodelindex.parent(), row, row)
-                if parent_item:
-                    parent_item.remove_child(row)
-                model.endRemoveRows()
+                    group_name = item.get_group_name()
+                    msg = 'Deleting group: "{}". '.format(group_name)
+                    msg += 'Row: "{}"'.format(row)
+                    self.logMessage.emit(msg, logging.WARNING)
 
-                i += 1
+                    deleted_count += 1
+                    items_removed.append(group_name)
+                    # Group children were deleted, so any column header might need updating
+                    columns_to_update.update(range(0, model.columnCount(QModelIndex())))
 
-        # On second pass delete all selected group item
-        organized_indices, selection_count = self.get_selected_organized_environment_indices()
-        for parent_item_id in organized_indices.keys():
-            rows = reversed(sorted(organized_indices[parent_item_id].keys()))
-            for row in rows:
-                source_qmodelindex = organized_indices[parent_item_id][row]
-                if not source_qmodelindex.isValid():
-                    continue
-                if source_qmodelindex.column() != 0:
-                    continue
-                item = source_qmodelindex.internalPointer()
-                if not item.is_group_item():
-                    continue
-                row = source_qmodelindex.row()
-
-                # Remove Groups children first
-                _row_count = item.child_count()
-                if _row_count:
-                    model.beginRemoveRows(source_qmodelindex, 0, _row_count)
-                    for _row in range(_row_count):
-                        _child = item.children()[0]
-                        msg = ' - Deleting environment: "{}". '.format(_child.get_oz_area())
-                        self.logMessage.emit(msg, logging.WARNING)
-                        item.remove_child(0)
+                    # Now remove this item at this level
+                    model.beginRemoveRows(source_qmodelindex.parent(), row, row)
+                    item.parent().remove_child(row)
                     model.endRemoveRows()
 
-                group_name = item.get_group_name()
-                msg = 'Deleting group: "{}". '.format(group_name)
-                msg += 'Row: "{}"'.format(row)
-                self.logMessage.emit(msg, logging.WARNING)
-
-                delete_item_ids.add(id(item))
-                items_removed.append(group_name)
-
-                # Now remove this item at this level
-                model.beginRemoveRows(source_qmodelindex.parent(), row, row)
-                item.parent().remove_child(row)
-                model.endRemoveRows()
-
-        if delete_item_ids:
-            # Some environments were deleted so update cached indices
-            model._update_environments_indices()
-            # Update column headers
-            all_columns = set(range(0, model.columnCount(QModelIndex())))
-            self._update_header_columns(all_columns)
+            if deleted_count:
+                # Some environments were deleted so update cached indices
+                model._update_environments_indices()
+            # Update only the column headers with changed renderable counts
+            if columns_to_update:
+                self._update_header_columns(sorted(columns_to_update))
 
-        # Emit signal so splash screen might become visible
-        if items_removed:
-            model.itemsRemoved.emit(items_removed)
+            # Emit signal so splash screen might become visible
+            if items_removed:
+                model.itemsRemoved.emit(items_removed)
 
-        # Allow selection model signals again.
-        selection_model.blockSignals(False)
+            # Allow selection model signals again.
+            selection_model.blockSignals(False)
 
-        model.toggleProgressBarVisible.emit(False)
+            model.toggleProgressBarVisible.emit(False)
 
-        if delete_item_ids:
+        # NOTE: Emit after the batch ends, so cached environments indices are rebuilt
+        if deleted_count:
             self.updateDetailsPanel.emit(False)
-            model.updateOverviewRequested.emit()
 
 
     def group_selected_items(
@@ -5824,13 +5847,9 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             # Count number of EnvironmentItem to group)
             rows_to_modify = 0
             for parent_item_id in organized_indices.keys():
-                rows = reversed(sorted(organized_indices[parent_item_id].keys()))
+                rows = sorted(organized_indices[parent_item_id], reverse=True)
                 for row in rows:
                     source_qmodelindex = organized_indices[parent_item_id][row]
-                    if not source_qmodelindex.isValid():
-                        continue
-                    if source_qmodelindex.column() != 0:
-                        continue
                     item = source_qmodelindex.internalPointer()
                     if item and item.is_environment_item():
                         rows_to_modify += 1
@@ -5839,7 +5858,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             msg = '<i>Group {} selected environments to new '.format(rows_to_modify)
             msg += 'group name</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose {}group{} name'.format(fs, fe),
                 description=msg,
@@ -5852,12 +5870,9 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 175)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
-            from srnd_qt.ui_framework.validators import element_name_validator
             validator = element_name_validator.ElementNameValidator(
                 allow_underscores=True,
                 allow_spaces=True)
@@ -5872,151 +5887,161 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 return False
             group_name = str(dialog.get_result() or group_name or str())
 
-        self.clearSelection()
-
-        # Block the selection model selectionChanged signals from possibly
-        # updating the details panel via the updateDetailsPanel signal.
-        selection_model = self.selectionModel()
-        selection_model.blockSignals(True)
-
-        progress_msg = 'Selection count to consider: {}'.format(selection_count)
-        self.logMessage.emit(progress_msg, logging.WARNING)
+        # Defer cached environments indices update and overview until all items are moved
+        with model._batched_model_updates():
+            self.clearSelection()
 
-        # Show progress bar
-        model.toggleProgressBarVisible.emit(True)
-        model.updateLoadingBarFormat.emit(0, progress_msg + ' - %p%')
+            # Block the selection model selectionChanged signals from possibly
+            # updating the details panel via the updateDetailsPanel signal.
+            selection_model = self.selectionModel()
+            selection_model.blockSignals(True)
 
-        if group:
-            group_item, qmodelindex_group = model.add_group(group_name=group_name)
-            model.expandRequested.emit(qmodelindex_group)
-        else:
-            root_item = model.get_root_node()
-            row_count_root_before = root_item.child_count()
+            progress_msg = 'Selection count to consider: {}'.format(selection_count)
+            self.logMessage.emit(progress_msg, logging.WARNING)
 
-        i = 0
-        environments_ids_modified = set()
-        for parent_item_id in organized_indices.keys():
-            rows = reversed(sorted(organized_indices[parent_item_id].keys()))
-            for row in rows:
+            # Show progress bar
+            model.toggleProgressBarVisible.emit(True)
+            model.updateLoadingBarFormat.emit(0, progress_msg + ' - %p%')
 
-                percent = int((float(i) / selection_count) * 100)
-                msg = 'Performing group or ungroup'
+            if group:
+                group_item, qmodelindex_group = model.add_group(group_name=group_name)
+                model.expandRequested.emit(qmodelindex_group)
+            else:
+                root_item = model.get_root_node()
+                row_count_root_before = root_item.child_count()
 
-                # Update loading bar
-                self.logMessage.emit(msg, logging.INFO)
-                self.updateLoadingBarFormat.emit(percent, msg + ' - %p%')
+            i = 0
+            last_percent = None
+            environments_ids_modified = 0
+            for parent_item_id in organized_indices.keys():
+                rows = sorted(organized_indices[parent_item_id], reverse=True)
+                # Environments to ungroup from this parent, which are moved in bulk after
+                ungroup_rows_items = list()
+                qmodelindex_ungroup_parent = None
+                for row in rows:
 
-                source_qmodelindex = organized_indices[parent_item_id][row]
-                if not source_qmodelindex.isValid():
-                    continue
-                if source_qmodelindex.column() != 0:
-                    continue
-                item = source_qmodelindex.internalPointer()
-                if not item:
-                    continue
+                    percent = int((float(i) / selection_count) * 100)
+                    msg = 'Performing group or ungroup'
 
-                if group and item.is_environment_item():
-                    oz_area = item.get_oz_area()
-                    oz_area_id = id(item)
+                    # Update loading bar, only when percent changes to limit repaints
+                    self.logMessage.emit(msg, logging.INFO)
+                    if percent != last_percent:
+                        self.updateLoadingBarFormat.emit(percent, msg + ' - %p%')
+                        last_percent = percent
 
-                    msg = 'Parenting environment: "{}"'.format(oz_area)
-                    msg += 'To group: "{}". '.format(group_name)
-                    msg += 'Moving row: "{}"'.format(row)
-                    self.logMessage.emit(msg, logging.WARNING)
+                    source_qmodelindex = organized_indices[parent_item_id][row]
+                    item = source_qmodelindex.internalPointer()
+                    if not item:
+                        continue
 
-                    # Remove the row
-                    model.beginRemoveRows(source_qmodelindex.parent(), row, row)
-                    item.parent().remove_child(row)
-                    model.endRemoveRows()
+                    if group and item.is_environment_item():
+                        oz_area = item.get_oz_area()
 
-                    # Insert the row under group
-                    model.beginInsertRows(qmodelindex_group, 0, 0)
-                    group_item.insert_child(0, item)
-                    model.endInsertRows()
-
-                    # # Move the rows at once (is currently problematic)....
-                    # model.beginMoveRows(
-                    #     source_qmodelindex.parent(),
-                    #     row,
-                    #     row,
-                    #     qmodelindex_group,
-                    #     0)
-                    # item.parent().remove_child(row)
-                    # group_item.insert_child(0, item)
-                    # model.endMoveRows()
-
-                    environments_ids_modified.add(oz_area_id)
-
-                elif not group and item.is_environment_item() and item.parent().is_group_item():
-                    oz_area = item.get_oz_area()
-                    oz_area_id = id(item)
-                    msg = 'Ungroup environment: "{}"'.format(oz_area)
-                    self.logMessage.emit(msg, logging.WARNING)
+                        msg = 'Parenting environment: "{}"'.format(oz_area)
+                        msg += 'To group: "{}". '.format(group_name)
+                        msg += 'Moving row: "{}"'.format(row)
+                        self.logMessage.emit(msg, logging.WARNING)
 
-                    model.beginMoveRows(
-                        source_qmodelindex.parent(),
-                        row,
-                        row,
-                        QModelIndex(),
-                        row_count_root_before)
-                    item.parent().remove_child(row)
-                    root_item.insert_child(row_count_root_before, item)
-                    model.endMoveRows()
+                        # Remove the row
+                        model.beginRemoveRows(source_qmodelindex.parent(), row, row)
+                        item.parent().remove_child(row)
+                        model.endRemoveRows()
+
+                        # Insert the row under group
+                        model.beginInsertRows(qmodelindex_group, 0, 0)
+                        group_item.insert_child(0, item)
+                        model.endInsertRows()
+
+                        # # Move the rows at once (is currently problematic)....
+                        # model.beginMoveRows(
+                        #     source_qmodelindex.parent(),
+                        #     row,
+                        #     row,
+                        #     qmodelindex_group,
+                        #     0)
+                        # item.parent().remove_child(row)
+                        # group_item.insert_child(0, item)
+                        # model.endMoveRows()
+
+                        environments_ids_modified += 1
+
+                    elif not group and item.is_environment_item() and item.parent().is_group_item():
+                        oz_area = item.get_oz_area()
+                        msg = 'Ungroup environment: "{}"'.format(oz_area)
+                        self.logMessage.emit(msg, logging.WARNING)
 
-                    environments_ids_modified.add(oz_area_id)
+                        qmodelindex_ungroup_parent = source_qmodelindex.parent()
+                        ungroup_rows_items.append((row, item))
 
-                elif not group and item.is_group_item():
-                    group_name = item.get_group_name()
-                    msg = 'Ungroup contents of group: "{}"'.format(group_name)
-                    self.logMessage.emit(msg, logging.WARNING)
+                        environments_ids_modified += 1
 
-                    _environment_items = item.children()
+                    elif not group and item.is_group_item():
+                        group_name = item.get_group_name()
+                        msg = 'Ungroup contents of group: "{}"'.format(group_name)
+                        self.logMessage.emit(msg, logging.WARNING)
 
-                    model.beginMoveRows(
-                        source_qmodelindex,
-                        0,
-                        item.child_count(),
+                        _environment_items = item.children()
+
+                        model.beginMoveRows(
+                            source_qmodelindex,
+                            0,
+                            item.child_count(),
+                            QModelIndex(),
+                            row_count_root_before)
+                        item.remove_children()
+                        for _environment_item in _environment_items:
+                            oz_area = _environment_item.get_oz_area()
+                            msg = 'Ungroup environment: "{}"'.format(oz_area)
+                            self.logMessage.emit(msg, logging.WARNING)
+                            environments_ids_modified += 1
+                            root_item.add_child(_environment_item)
+                        model.endMoveRows()
+
+                    i += 1
+
+                if ungroup_rows_items:
+                    self._move_child_rows(
+                        qmodelindex_ungroup_parent,
+                        ungroup_rows_items,
+                        root_item,
                         QModelIndex(),
                         row_count_root_before)
-                    item.remove_children()
-                    for _environment_item in _environment_items:
-                        oz_area = _environment_item.get_oz_area()
-                        _oz_area_id = id(_environment_item)
-                        msg = 'Ungroup environment: "{}"'.format(oz_area)
-                        self.logMessage.emit(msg, logging.WARNING)
-                        environments_ids_modified.add(_oz_area_id)
-                        root_item.add_child(_environment_item)
-                    model.endMoveRows()
 
-                i += 1
+            # Open editors for rows that don't already have them.
+            # NOTE: Rows moved by beginMoveRows keep their existing editors.
+            if group:
+                for row in range(model.rowCount(qmodelindex_group)):
+                    qmodelindex_new = model.index(row, 0, qmodelindex_group)
+                    if self.indexWidget(qmodelindex_new):
+                        continue
+                    model.openPersisentEditorForRowRequested.emit(qmodelindex_new)
+            else:
+                row_count = model.rowCount(QModelIndex())
+                for row in range(row_count_root_before, row_count, 1):
+                    qmodelindex_new = model.index(row, 0, QModelIndex())
+                    if self.indexWidget(qmodelindex_new):
+                        continue
+                    model.openPersisentEditorForRowRequested.emit(qmodelindex_new)
 
-        if group:
-            for row in range(model.rowCount(qmodelindex_group)):
-                qmodelindex_new = model.index(row, 0, qmodelindex_group)
-                model.openPersisentEditorForRowRequested.emit(qmodelindex_new)
-        else:
-            row_count = model.rowCount(QModelIndex())
-            for row in range(row_count_root_before, row_count, 1):
-                qmodelindex_new = model.index(row, 0, QModelIndex())
-                model.openPersisentEditorForRowRequested.emit(qmodelindex_new)
+            # Allow selection model signals again.
+            selection_model.blockSignals(False)
 
-        # Allow selection model signals again.
-        selection_model.blockSignals(False)
+            model.toggleProgressBarVisible.emit(False)
 
-        model.toggleProgressBarVisible.emit(False)
+            if environments_ids_modified:
+                # Some environments might have changed order during group so update cached indices.
+                # NOTE: The overview of Multi Shot targets is updated when the batch ends.
+                model._update_environments_indices()
 
+        # Emit the updateDetailsPanel so details panel now updates.
+        # NOTE: Emit after the batch ends, so cached environments indices are rebuilt
         if environments_ids_modified:
-            # Some environments might have changed order during group so update cached indices
-            model._update_environments_indices()
-            # Emit the updateDetailsPanel so details panel now updates
             self.updateDetailsPanel.emit(False)
-            # Update overview of Multi Shot targets
-            model.updateOverviewRequested.emit()
 
         # NOTE: Make sure this tree view has focus for next key press shortcut
         self.setFocus(Qt.ShortcutFocusReason)
 
-        return len(environments_ids_modified)
+        return environments_ids_modified
 
 
     def change_areas_selected_items(
@@ -6064,30 +6089,40 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         model = self.model()
 
-        environments_ids_modified = 0
-        for qmodelindex in selection:
-            if not qmodelindex.isValid:
-                continue
-            item = qmodelindex.internalPointer()
-            if not item.is_environment_item():
-                continue
-            identifier = item.get_identifier()
-            current_area = item.get_oz_area()
-            if current_area == area:
-                msg = 'No change to environment required: "{}"'.format(identifier)
-                self.logMessage.emit(msg, logging.WARNING)
-                continue
-            item.set_area(area)
+        # Defer cached environments indices update and overview until all areas are changed
+        with model._batched_model_updates():
+            environments_ids_modified = 0
+            qmodelindices_changed = list()
+            for qmodelindex in selection:
+                if not qmodelindex.isValid:
+                    continue
+                item = qmodelindex.internalPointer()
+                if not item.is_environment_item():
+                    continue
+                identifier = item.get_identifier()
+                current_area = item.get_oz_area()
+                if current_area == area:
+                    msg = 'No change to environment required: "{}"'.format(identifier)
+                    self.logMessage.emit(msg, logging.WARNING)
+                    continue
+                item.set_area(area)
+
+                qmodelindices_changed.append(qmodelindex)
 
-            model.dataChanged.emit(qmodelindex, qmodelindex)
+                environments_ids_modified += 1
 
-            environments_ids_modified += 1
+            # Emit data changed once per contiguous range of changed rows
+            self._emit_data_changed_for_rows(qmodelindices_changed)
 
+            if environments_ids_modified:
+                # Changed areas affect the nth index of environments so update cached indices.
+                # NOTE: The overview of Multi Shot targets is updated when the batch ends.
+                model._update_environments_indices()
+
+        # Emit the updateDetailsPanel so details panel now updates.
+        # NOTE: Emit after the batch ends, so cached environments indices are rebuilt
         if environments_ids_modified:
-            # Emit the updateDetailsPanel so details panel now updates
             self.updateDetailsPanel.emit(False)
-            # Update overview of Multi Shot targets
-            model.updateOverviewRequested.emit()
 
         return environments_ids_modified
 
@@ -6123,17 +6158,17 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             if split == is_split:
                 continue
             item.set_split_frame_ranges(split)
-            model.dataChanged.emit(qmodelindex, qmodelindex)
             success_count += 1
 
-            # Remove any frame overrides on pass for env cells
-            for c in range(1, column_count):
-                qmodelindex_cell = qmodelindex.sibling(qmodelindex.row(), c)
-                if not qmodelindex_cell.isValid():
-                    continue
-                pass_env_item = qmodelindex_cell.internalPointer()
+            # Remove any frame overrides on pass for env cells.
+            # NOTE: The sibling items are the pass for env items, so no need to build indices.
+            for pass_env_item in item.get_pass_for_env_items():
                 pass_env_item.clear_frame_overrides()
-                model.dataChanged.emit(qmodelindex_cell, qmodelindex_cell)
+
+            # Emit one data changed for the environment and all pass for env cells of row
+            row = qmodelindex.row()
+            qmodelindex_last = qmodelindex.sibling(row, column_count - 1)
+            model.dataChanged.emit(qmodelindex, qmodelindex_last)
 
         msg = 'Setting split frames jobs to: {}. '.format(split)
         msg += 'For {} selected environment item/s'.format(len(environment_items))
@@ -6156,6 +6191,19 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         return self.group_selected_items(group=False)
 
 
+    def _get_set_name_validator(self):
+        '''
+        Get the validator for selection and visibility set names, which is
+        only created once and then shared by every set name dialog.
+
+        Returns:
+            validator (QRegExpValidator):
+        '''
+        if not self._set_name_validator:
+            self._set_name_validator = QRegExpValidator(self.SET_NAME_REGEXP, self)
+        return self._set_name_validator
+
+
     def create_item_selection_set(self, name=None, show_dialog=True):
         '''
         Get all selected environment and render pass for env items, and store
@@ -6186,7 +6234,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         if show_dialog:
             msg = '<i>Choose name to represent new selection set name</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose selection {}set name{}'.format(fs, fe),
                 description=msg,
@@ -6199,14 +6246,10 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 175)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
-            validator = QRegExpValidator()
-            validator.setRegExp(QRegExp('[A-Za-z0-9_ ]+'))
-            value_widget.setValidator(validator)
+            value_widget.setValidator(self._get_set_name_validator())
             result = dialog.exec_()
             if result == QDialog.Rejected or not value_widget.text():
                 msg = 'User cancelled or provided no value for selection set name!'
@@ -6285,7 +6328,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         if not identifiers:
             identifiers = list()
 
-        if not any([identity_ids, identifiers]):
+        if not (identity_ids or identifiers):
             msg = 'No UUIDs or identifiers to select by!'
             self.logMessage.emit(msg, logging.WARNING)
             return 0
@@ -6299,52 +6342,24 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         model = self.model()
 
-        selection_model = self.selectionModel()
-        self.clearSelection()
-
-        selected_count = 0
+        # Lookup environment and pass for env indices by UUID and / or identifier
+        # from the models cached mapping, rather than testing every index.
+        # NOTE: Environment matches by nice name (which might include job name or index),
+        # or by area. Pass for env matches by identifier including nice env name.
+        qmodelindices_to_select = model.get_indices_by_uuids_or_identifiers(
+            uuids=identity_ids,
+            identifiers=identifiers)
+        selected_count = len(qmodelindices_to_select)
         scroll_qmodelindex = None
+        if scroll_to and qmodelindices_to_select:
+            scroll_qmodelindex = qmodelindices_to_select[0]
 
-        for qmodelindex in model.get_environment_items_indices():
-            if not qmodelindex.isValid():
-                continue
-            item = qmodelindex.internalPointer()
-            do_select = False
-            # Check for matching uuid for environment
-            if not do_select and identity_ids:
-                do_select = item.get_identity_id() in identity_ids
-            # Otherwise check for matching environment name
-            if not do_select and identifiers:
-                # Nice name might include job name or index as part of environment string
-                do_select = item.get_environment_name_nice() in identifiers
-                # Otherwise fallback for simple area match
-                if not do_select:
-                    do_select = item.get_oz_area() in identifiers   
-            if do_select:
-                selection_model.select(qmodelindex, QItemSelectionModel.Select)
-                selected_count += 1
-                if scroll_to and not scroll_qmodelindex:
-                    scroll_qmodelindex = qmodelindex
+        # Select all matching indices with one call, to avoid the selection model
+        # merging and emitting selectionChanged for every index.
+        selection = self._build_merged_selection(qmodelindices_to_select)
+        selection_model = self.selectionModel()
+        selection_model.select(selection, QItemSelectionModel.ClearAndSelect)
 
-        for qmodelindex in model.get_pass_for_env_items_indices():
-            if not qmodelindex.isValid():
-                continue
-            item = qmodelindex.internalPointer()
-            do_select = False
-            # Check for matching uuid for pass
-            if not do_select and identity_ids:
-                do_select = item.get_identity_id() in identity_ids
-            # Otherwise check for matching pass name
-            if not do_select and identifiers:
-                # Nice env name is included as full item path to pass.
-                # Which includes job name or index of environment.
-                do_select = item.get_identifier(nice_env_name=True) in identifiers
-            if do_select:
-                selection_model.select(qmodelindex, QItemSelectionModel.Select)
-                selected_count += 1
-                if scroll_to and not scroll_qmodelindex:
-                    scroll_qmodelindex = qmodelindex
-        
         if scroll_qmodelindex and scroll_qmodelindex.isValid():
             self.scrollTo(scroll_qmodelindex, hint=self.PositionAtCenter)
 
@@ -6431,11 +6446,12 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         model = self.model()
 
         # Collect mapping of item full names, mapped to visibility states
-        render_nodes_to_visible_map = collections.OrderedDict()
-        for c, render_item in enumerate(model.get_render_items()):
-            visible = not self.isColumnHidden(c + 1)
-            item_full_name = render_item.get_item_full_name()
-            render_nodes_to_visible_map[item_full_name] = visible
+        item_full_names = [
+            render_item.get_item_full_name() for render_item in model.get_render_items()]
+        is_column_hidden = self.isColumnHidden
+        render_nodes_to_visible_map = INSERTION_ORDERED_DICT()
+        for c, item_full_name in enumerate(item_full_names):
+            render_nodes_to_visible_map[item_full_name] = not is_column_hidden(c + 1)
 
         if not render_nodes_to_visible_map:
             msg = 'No columns to make pass visibility set for!'
@@ -6451,7 +6467,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         if show_dialog:
             msg = '<i>Choose name to represent new pass visibility set</i>'
 
-            from srnd_qt.ui_framework.dialogs import input_dialog
             dialog = input_dialog.GetInputDialog(
                 title_str='Choose Pass Visibility {}Set Name{}'.format(fs, fe),
                 description=msg,
@@ -6464,14 +6479,10 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             dialog.resize(575, 175)
 
             options_box_header = dialog.get_header_widget()
-            style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-            style_sheet += 'border:rgb(70, 70, 70)}'
-            options_box_header.setStyleSheet(style_sheet)
+            options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
             value_widget = dialog.get_value_widget()
-            validator = QRegExpValidator()
-            validator.setRegExp(QRegExp('[A-Za-z0-9_ ]+'))
-            value_widget.setValidator(validator)
+            value_widget.setValidator(self._get_set_name_validator())
             result = dialog.exec_()
             if result == QDialog.Rejected or not value_widget.text():
                 msg = 'User cancelled or provided no value for render node visibility set name!'
@@ -6485,7 +6496,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             self.logMessage.emit(msg, logging.WARNING)
             return None, list()
 
-        if show_dialog and name in self._pass_visibility_sets.keys():
+        if show_dialog and name in self._pass_visibility_sets:
             msg = 'Pass visibility set name not unique!'
             self.logMessage.emit(msg, logging.WARNING)
             reply = QMessageBox.warning(
@@ -6498,7 +6509,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         self._pass_visibility_sets[name] = render_nodes_to_visible_map
 
         msg = 'Successfully created pass visibility set name: "{}". '.format(name)
-        msg += 'Containing iender items: "{}"'.format(render_nodes_to_visible_map.keys())
+        msg += 'Containing iender items: "{}"'.format(list(render_nodes_to_visible_map))
         self.logMessage.emit(msg, logging.INFO)
 
         return name, self._pass_visibility_sets[name]
@@ -6530,22 +6541,28 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             self.logMessage.emit(msg, logging.WARNING)
             return list(), list()
 
+        item_full_names = [
+            render_item.get_item_full_name() for render_item in model.get_render_items()]
+        set_column_hidden = self.setColumnHidden
+        is_column_hidden = self.isColumnHidden
+
         pass_names_visible = list()
         pass_names_hidden = list()
-        for c, render_item in enumerate(model.get_render_items()):
-            item_full_name = render_item.get_item_full_name()
-            if item_full_name not in render_nodes_to_visible_map.keys():
-                continue
-            visible = bool(render_nodes_to_visible_map.get(item_full_name, True))
-            self.setColumnHidden(c + 1, not visible)
-            if visible:
-                pass_names_visible.append(item_full_name)
-            else:
-                pass_names_hidden.append(item_full_name)
+        with self._batched_view_updates():
+            for c, item_full_name in enumerate(item_full_names):
+                if item_full_name not in render_nodes_to_visible_map:
+                    continue
+                visible = bool(render_nodes_to_visible_map.get(item_full_name, True))
+                if is_column_hidden(c + 1) == visible:
+                    set_column_hidden(c + 1, not visible)
+                if visible:
+                    pass_names_visible.append(item_full_name)
+                else:
+                    pass_names_hidden.append(item_full_name)
 
         if self._overlay_widget:
             self._overlay_widget.set_active(True)
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
         msg = 'Pass columns made visibile by apply set: "{}"'.format(pass_names_visible)
         self.logMessage.emit(msg, logging.WARNING)
@@ -6614,8 +6631,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         model = self.model()
         columns_state = dict()
         for qmodelindex in model.get_environment_items_indices():
-            if not qmodelindex.isValid():
-                continue
             env_item = qmodelindex.internalPointer()
             for c, pass_for_env in enumerate(env_item.get_pass_for_env_items()):
                 column = c + 1
@@ -6626,6 +6641,34 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         return columns_state
 
 
+    def get_columns_any_active(self):
+        '''
+        Formulate a mapping of column number to whether any row of column is active.
+        Note: Stops checking a column once an active item is found.
+
+        Returns:
+            columns_any_active (dict):
+        '''
+        model = self.model()
+        columns_any_active = dict()
+        active_count = 0
+        column_count = model.columnCount(QModelIndex()) - 1
+        for qmodelindex in model.get_environment_items_indices():
+            env_item = qmodelindex.internalPointer()
+            for c, pass_for_env in enumerate(env_item.get_pass_for_env_items()):
+                column = c + 1
+                if columns_any_active.get(column):
+                    continue
+                active = pass_for_env.get_active()
+                columns_any_active[column] = active
+                if active:
+                    active_count += 1
+            # Every column already has an active item
+            if active_count >= column_count:
+                break
+        return columns_any_active
+
+
     def toggle_columns_by_state(
             self,
             hide_inactive=False,
@@ -6643,35 +6686,35 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         if self._overlay_widget:
             self._overlay_widget.set_active(False)
 
-        selected_columns = set()
         if hide_selected:
-            for qmodelindex in self.selectedIndexes():
-                if not qmodelindex.isValid():
-                    continue
-                selected_columns.add(qmodelindex.column())
-
-        # Formulate a mapping of column number to active state list.
-        columns_state = self.get_column_states()
-
-        for c in columns_state:
-            hide = None
-            # Check if any one row of column is active
-            visible_current = any(columns_state[c])
-            # Show columns that have at least one active row
-            if show_active and visible_current:
-                hide = False
-            # Hide columns that have no active rows
-            if hide_inactive and not visible_current:
-                hide = True
-            # Hide selected columns and not already hidden
-            if hide_selected and selected_columns and c in selected_columns:
-                hide = True
-            if isinstance(hide, bool):
-                self.setColumnHidden(c, hide)
+            selected_columns = set(
+                qmodelindex.column() for qmodelindex in self.selectedIndexes()
+                if qmodelindex.isValid())
+        else:
+            selected_columns = frozenset()
+
+        # Formulate a mapping of column number to whether any one row of column is active
+        columns_any_active = self.get_columns_any_active()
+
+        with self._batched_view_updates():
+            for c in columns_any_active:
+                hide = None
+                visible_current = columns_any_active[c]
+                # Show columns that have at least one active row
+                if show_active and visible_current:
+                    hide = False
+                # Hide columns that have no active rows
+                if hide_inactive and not visible_current:
+                    hide = True
+                # Hide selected columns and not already hidden
+                if c in selected_columns:
+                    hide = True
+                if isinstance(hide, bool) and self.isColumnHidden(c) != hide:
+                    self.setColumnHidden(c, hide)
 
         if self._overlay_widget:
             self._overlay_widget.set_active(True)
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
 
     def set_all_columns_visible(self, show=True, skip_columns=None):
@@ -6688,7 +6731,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             skip_columns=skip_columns)
         if self._overlay_widget:
             self._overlay_widget.set_active(True)
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
 
     def derive_highest_version_and_apply(self):
@@ -6710,30 +6753,35 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         # Gather highest version for Environment or pass
         # NOTE: Dont cache versions on pass for env items.
+        # NOTE: Each pass is only resolved once, even when the Environment is also selected.
         # TODO: Add method elsewhere to do this.
-        versions = set()
+        version_system = constants.CG_VERSION_SYSTEM_PASS_NEXT
+        resolved = dict()
         environment_ids = set()
+        selected_items = list()
         for qmodelindex in selection:
             if not qmodelindex.isValid():
                 continue
             item = qmodelindex.internalPointer()
-            if item.is_pass_for_env_item():
-                version_number = item.resolve_version(
-                    version_system=constants.CG_VERSION_SYSTEM_PASS_NEXT,
+            is_pass_for_env_item = item.is_pass_for_env_item()
+            if is_pass_for_env_item:
+                pass_env_items = [item]
+            elif item.is_environment_item():
+                pass_env_items = item.get_pass_for_env_items()
+                environment_ids.add(item.get_identity_id())
+            else:
+                continue
+            selected_items.append((qmodelindex, item, is_pass_for_env_item))
+            for pass_env_item in pass_env_items:
+                pass_env_item_id = id(pass_env_item)
+                if pass_env_item_id in resolved:
+                    continue
+                resolved[pass_env_item_id] = pass_env_item.resolve_version(
+                    version_system=version_system,
                     cache_values=False,
                     collapse_version_overrides=False)
-                if version_number:
-                    versions.add(version_number)
-            if item.is_environment_item():
-                for pass_env_item in item.get_pass_for_env_items():
-                    # Resolve the version again
-                    version_number = pass_env_item.resolve_version(
-                        version_system=constants.CG_VERSION_SYSTEM_PASS_NEXT,
-                        cache_values=False,
-                        collapse_version_overrides=False)
-                    if version_number:
-                        versions.add(version_number)
-                environment_ids.add(id(item))
+
+        versions = [version_number for version_number in resolved.values() if version_number]
         if not versions:
             msg = 'Derived No Highest Version To Apply!'
             self.logMessage.emit(msg, logging.WARNING)
@@ -6744,21 +6792,12 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         self.logMessage.emit(msg, logging.INFO)
 
         model = self.model()
-        for qmodelindex in selection:
-            if not qmodelindex.isValid():
-                continue
-            item = qmodelindex.internalPointer()
-            is_environment_item = item.is_environment_item()
-            is_pass_for_env_item = item.is_pass_for_env_item()
-
-            if not any([is_environment_item, is_pass_for_env_item]):
-                continue
-
+        for qmodelindex, item, is_pass_for_env_item in selected_items:
             # If the environment was also selected, only apply the override at this level
             do_set_version = True
-            if item.is_pass_for_env_item() and environment_ids:
+            if is_pass_for_env_item and environment_ids:
                 environment_item = item.parent()
-                do_set_version = id(environment_item) in environment_ids
+                do_set_version = environment_item.get_identity_id() in environment_ids
 
             if do_set_version:
                 was_version_override = item.get_version_override()
@@ -6792,6 +6831,10 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         initial_value = '1-10'
 
+        font_metrics = QFontMetrics(app.font())
+        # NOTE: horizontalAdvance is only available from Qt 5.11
+        get_text_width = getattr(font_metrics, 'horizontalAdvance', font_metrics.width)
+
         widths = list()
         for i, qmodelindex in enumerate(selected_indices):
             item = qmodelindex.internalPointer()
@@ -6842,7 +6885,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
             msg_item += '</ul>'
 
-            widths.append(QFontMetrics(app.font()).width(identifier))
+            widths.append(get_text_width(identifier))
 
             msg_preview += msg_item
 
@@ -6851,7 +6894,6 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         msg_more_details = '<i>Entering values outside each respective '
         msg_more_details += 'shot frame range is possible.</i>'
 
-        from srnd_qt.ui_framework.dialogs import input_dialog
         dialog = input_dialog.GetInputDialog(
             title_str=title_str,
             description=msg_more_details,
@@ -6866,9 +6908,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         dialog.setWindowTitle(window_title)
 
         options_box_header = dialog.get_header_widget()
-        style_sheet = 'QGroupBox {background: rgb(70, 70, 70);'
-        style_sheet += 'border:rgb(70, 70, 70)}'
-        options_box_header.setStyleSheet(style_sheet)
+        options_box_header.setStyleSheet(DIALOG_HEADER_STYLE_SHEET)
 
         value_widget = dialog.get_value_widget()
         from srnd_qt.ui_framework.validators import frames_validator
@@ -6924,6 +6964,8 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         such as whether search filter is "active".
         Note: This is a temporary search filter only, so not filtering by a proxy model any further here.
         Note: Hidden indices should not be filtered out of the model by this search.
+        Note: When no search filter is active, all rows and columns are shown in one
+        batched pass and no item is searched.
 
         Args:
             search_filters (dict):
@@ -6941,78 +6983,123 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 self.exit_wait_on_interactive()
             self._overlay_widget.set_active(False)
 
-        # Show everything first
-        self._show_all_rows_and_columns()
-
         # msg = 'Apply Search Filters Requested: "{}"'.format(search_filters)
         # self.logMessage.emit(msg, logging.INFO)
 
         column_count = model.columnCount(QModelIndex())
 
-        FILTER_MODIFIERS = (
-            'env:', 'area:', 'environment:', 'shot:', 'job:', # for environment items
-            'pass:', 'frame:', 'frames:', 'note:', 'notes:') # for pass for env items
-        ENV_FILTERS_MODIFIERS = ('env:', 'area:', 'environment:', 'shot:', 'job:')
-        PASS_FILTERS_MODIFIERS = ('pass:')
-
         count = 0
 
+        # Partition the active search filters once, into those relevant to check against
+        # environment items, and those relevant to check against pass for env items.
+        # Each is a tuple of search filter, whether hide mode, and whether a match affects
+        # the column and / or the row. NOTE: Frame or note match affects both column and row,
+        # otherwise pass for env match affects column, and environment match affects row.
+        active_search_filters = list()
+        env_search_filters = list()
+        pass_search_filters = list()
+        for search_filter, search_details in (search_filters or dict()).items():
+            if not search_details.get('active', True):
+                continue
+            active_search_filters.append(search_filter)
+            hide = 'Hide' in search_details.get('search_mode', str())
+            is_frame_or_note = search_filter.startswith(SEARCH_FRAME_NOTE_FILTERS_MODIFIERS)
+            # Request to check only pass items
+            if not search_filter.startswith(SEARCH_PASS_FILTERS_MODIFIERS):
+                env_search_filters.append(
+                    (search_filter, hide, is_frame_or_note, True))
+            # Request to check only environment items
+            if not search_filter.startswith(SEARCH_ENV_FILTERS_MODIFIERS):
+                pass_search_filters.append(
+                    (search_filter, hide, True, is_frame_or_note))
+        active_search_filter_count = len(active_search_filters)
+
+        # Show everything first
+        self._show_all_rows_and_columns()
+
+        # Nothing more to filter, so skip checking every cell
+        if not active_search_filter_count:
+            if self._overlay_widget:
+                self._overlay_widget.set_active(True)
+                self._schedule_overlay_update()
+            return count
+
+        # Bind frequently called methods to locals for the loops below
+        is_column_hidden = self.isColumnHidden
+        set_column_hidden = self.setColumnHidden
+        is_row_hidden = self.isRowHidden
+        set_row_hidden = self.setRowHidden
+
+        # NOTE: Only valid environment item indices are returned, so group items are already skipped
+        env_indices = model.get_environment_items_indices()
+
         # Now search for matches on every cell
-        active_search_filter_count = 0
         columns_to_show = set()
         columns_to_hide = set()
         item_ids_rows_to_show = set()
         item_ids_rows_to_hide = set()
-        for qmodelindex_env in model.get_environment_items_indices():
-            if not qmodelindex_env.isValid():
-                continue
+        # Results of searching environment items, keyed by identity id and search filter,
+        # so the fallback search mode below doesnt repeat the same search.
+        # NOTE: Only kept for this search, since items can change without dataChanged.
+        env_search_results = dict()
+        # The environment item, identity id, row and parent of every environment row,
+        # so the row visibility loops below dont query these again.
+        env_rows = list()
+        for qmodelindex_env in env_indices:
             env_item = qmodelindex_env.internalPointer()
+            env_identity_id = env_item.get_identity_id()
             row_match_count = 0
             row_not_match_count = 0
+            row = qmodelindex_env.row()
+            env_rows.append((env_item, env_identity_id, row, qmodelindex_env.parent()))
             for c in range(column_count):
-                qmodelindex_cell = qmodelindex_env.sibling(qmodelindex_env.row(), c)
+                qmodelindex_cell = qmodelindex_env.sibling(row, c)
                 if not qmodelindex_cell.isValid():
                     continue
                 item = qmodelindex_cell.internalPointer()
-                # Check for match for this cell for every possible rule
-                for search_filter in search_filters.keys():
-                    # Search filter not active
-                    active = search_filters[search_filter].get('active', True)
-                    search_mode = search_filters[search_filter].get('search_mode', str())
-                    if not active:
-                        continue
-                    active_search_filter_count += 1
-                    # Request to check only pass items
-                    if search_filter.startswith(PASS_FILTERS_MODIFIERS) and not item.is_pass_for_env_item():
+                # NOTE: Column 0 of an environment row is always the environment item,
+                # and every other column is a pass for env item.
+                if c:
+                    _search_filters = pass_search_filters
+                else:
+                    _search_filters = env_search_filters
+                # Check for match for this cell for every relevant rule
+                for search_filter, hide, affects_column, affects_row in _search_filters:
+                    if hide:
+                        columns = columns_to_hide
+                        row_matched = row_not_match_count
+                    else:
+                        columns = columns_to_show
+                        row_matched = row_match_count
+                    # Skip searching when any match would have no further effect,
+                    # because column and / or row is already matched by this mode.
+                    column_required = affects_column and c not in columns
+                    row_required = affects_row and not row_matched
+                    if not column_required and not row_required:
                         continue
-                    # Request to check only environment items
-                    if search_filter.startswith(ENV_FILTERS_MODIFIERS) and not item.is_environment_item():
+                    if c:
+                        found = item.search_for_string(search_filter)
+                    else:
+                        key = (env_identity_id, search_filter)
+                        found = env_search_results.get(key)
+                        if found is None:
+                            found = item.search_for_string(search_filter)
+                            env_search_results[key] = found
+                    if not found:
                         continue
-                    found = item.search_for_string(search_filter)
-                    if found and 'Hide' in search_mode:
-                        if search_filter.startswith(('frame:', 'frames:', 'note:', 'notes:')):
-                            columns_to_hide.add(c)
-                            row_not_match_count += 1
-                        elif item.is_pass_for_env_item() or search_filter.startswith(PASS_FILTERS_MODIFIERS):
-                            columns_to_hide.add(c)
-                        else:
+                    if affects_column:
+                        columns.add(c)
+                    if affects_row:
+                        if hide:
                             row_not_match_count += 1
-                        # break
-                    elif found:
-                        if search_filter.startswith(('frame:', 'frames:', 'note:', 'notes:')):
-                            columns_to_show.add(c)
-                            row_match_count += 1
-                        elif item.is_pass_for_env_item() or search_filter.startswith(PASS_FILTERS_MODIFIERS):
-                            columns_to_show.add(c)
                         else:
                             row_match_count += 1
-                        # break
             # Row has at least one NOT match
             if row_not_match_count:
-                item_ids_rows_to_hide.add(id(env_item))
+                item_ids_rows_to_hide.add(env_identity_id)
             # Found a match on any column of row
             if row_match_count:
-                item_ids_rows_to_show.add(id(env_item))
+                item_ids_rows_to_show.add(env_identity_id)
 
             # msg = 'Env: "{}". '.format(env_item.get_environment_name_nice())
             # msg += 'Row Match Count: "{}". '.format(row_match_count)
@@ -7022,93 +7109,107 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         # msg = 'Columns To Show: "{}"'.format(columns_to_show)
         # self.logMessage.emit(msg, logging.DEBUG)
 
-        if columns_to_hide:
-            for c in range(1, column_count):
-                hide = c in columns_to_hide
-                if invert:
-                    hide = not hide
-                
-                self.setColumnHidden(c, hide)
-                count += 1
-
-        # Show and hide particular columns
-        if columns_to_show:
-            # NOTE: Column 0 is prevented from being filtered out
-            for c in range(1, column_count):
-                hide = c not in columns_to_show
-                if invert:
-                    hide = not hide
-                self.setColumnHidden(c, hide)
-                count += 1
-
-        # Hide rows
-        if item_ids_rows_to_hide:
-            # msg = 'Row Item Ids To Hide: "{}"'.format(item_ids_rows_to_hide)
-            # self.logMessage.emit(msg, logging.DEBUG)
-            for qmodelindex_env in model.get_environment_items_indices():
-                if not qmodelindex_env.isValid():
-                    continue
-                env_item = qmodelindex_env.internalPointer()
-                hide = id(env_item) in item_ids_rows_to_hide
-                if invert:
-                    hide = not hide
-                self.setRowHidden(
-                    qmodelindex_env.row(),
-                    qmodelindex_env.parent(),
-                    hide)
-                count += 1
-
-        # Show rows
-        if item_ids_rows_to_show:
-            # msg = 'Row Item Ids To Show: "{}"'.format(item_ids_rows_to_show)
-            # self.logMessage.emit(msg, logging.DEBUG)
-            for qmodelindex_env in model.get_environment_items_indices():
-                if not qmodelindex_env.isValid():
-                    continue
-                env_item = qmodelindex_env.internalPointer()
-                hide = id(env_item) not in item_ids_rows_to_show
-                if invert:
-                    hide = not hide
-                self.setRowHidden(
-                    qmodelindex_env.row(),
-                    qmodelindex_env.parent(),
-                    hide)
-                count += 1
-
-        # Fallback search mode. Searches env items only for matches.
-        if not any([item_ids_rows_to_show, item_ids_rows_to_hide]) \
-                and not any([columns_to_show, columns_to_hide]):
-            if search_filters and active_search_filter_count:
-                for qmodelindex_env in model.get_environment_items_indices():
-                    if not qmodelindex_env.isValid():
-                        continue
-                    env_item = qmodelindex_env.internalPointer()
-                    show = False
-                    for search_filter in search_filters.keys():
-                        active = search_filters[search_filter].get('active', True)
-                        if not active:
-                            continue
-                        found = env_item.search_for_string(search_filter)
-                        if found:
-                            show = True
+        with self._batched_view_updates():
+            if columns_to_hide:
+                for c in range(1, column_count):
+                    hide = c in columns_to_hide
+                    if invert:
+                        hide = not hide
+                    if is_column_hidden(c) != hide:
+                        set_column_hidden(c, hide)
+                    count += 1
+
+            # Show and hide particular columns
+            if columns_to_show:
+                # NOTE: Column 0 is prevented from being filtered out
+                for c in range(1, column_count):
+                    hide = c not in columns_to_show
+                    if invert:
+                        hide = not hide
+                    if is_column_hidden(c) != hide:
+                        set_column_hidden(c, hide)
+                    count += 1
+
+            # Hide rows
+            if item_ids_rows_to_hide:
+                # msg = 'Row Item Ids To Hide: "{}"'.format(item_ids_rows_to_hide)
+                # self.logMessage.emit(msg, logging.DEBUG)
+                for env_item, env_identity_id, row, qmodelindex_parent in env_rows:
+                    hide = env_identity_id in item_ids_rows_to_hide
+                    if invert:
+                        hide = not hide
+                    if is_row_hidden(row, qmodelindex_parent) != hide:
+                        set_row_hidden(row, qmodelindex_parent, hide)
+                    count += 1
+
+            # Show rows
+            if item_ids_rows_to_show:
+                # msg = 'Row Item Ids To Show: "{}"'.format(item_ids_rows_to_show)
+                # self.logMessage.emit(msg, logging.DEBUG)
+                for env_item, env_identity_id, row, qmodelindex_parent in env_rows:
+                    hide = env_identity_id not in item_ids_rows_to_show
+                    if invert:
+                        hide = not hide
+                    if is_row_hidden(row, qmodelindex_parent) != hide:
+                        set_row_hidden(row, qmodelindex_parent, hide)
+                    count += 1
+
+            # Fallback search mode. Searches env items only for matches.
+            # NOTE: At least one search filter is active, otherwise returned earlier.
+            if not (item_ids_rows_to_show or item_ids_rows_to_hide or \
+                    columns_to_show or columns_to_hide):
+                for env_item, env_identity_id, row, qmodelindex_parent in env_rows:
+                    show = False
+                    for search_filter in active_search_filters:
+                        key = (env_identity_id, search_filter)
+                        found = env_search_results.get(key)
+                        if found is None:
+                            found = env_item.search_for_string(search_filter)
+                            env_search_results[key] = found
+                        if found:
+                            show = True
                             break
                     hide = not show
                     if invert:
                         hide = not hide
-                    self.setRowHidden(
-                        qmodelindex_env.row(),
-                        qmodelindex_env.parent(),
-                        hide)
+                    if is_row_hidden(row, qmodelindex_parent) != hide:
+                        set_row_hidden(row, qmodelindex_parent, hide)
                     count += 1
 
         if self._overlay_widget:
             self._overlay_widget.set_active(True)
             # QApplication.processEvents()
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
         return count
 
 
+    @contextlib.contextmanager
+    def _batched_view_updates(self):
+        '''
+        Context manager to disable view updates while changing many rows or columns
+        visibility or structure, so the viewport is only repainted once on exit.
+        Note: Active overlays are also suspended, and only updated once on exit.
+        '''
+        updates_enabled = self.updatesEnabled()
+        overlays_active = bool(updates_enabled and self._overlay_widget \
+            and self._overlay_widget.get_active())
+        if updates_enabled:
+            self.setUpdatesEnabled(False)
+        if overlays_active:
+            self._overlay_widget.set_active(False)
+        try:
+            yield
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+            if overlays_active:
+                self._overlay_widget.set_active(True)
+                self._schedule_overlay_update()
+            if updates_enabled:
+                self.viewport().update()
+
+
     def _show_all_rows_and_columns(self):
         '''
         Show all rows and columns for entire view of model.
@@ -7116,15 +7217,15 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         model = self.model()
         if not model:
             return
-        render_items = model.get_render_items()
-        for i in range(model.columnCount(QModelIndex())):
-            self.setColumnHidden(i, False)
-        for qmodelindex in model.get_environment_items_indices():
-            row = qmodelindex.row()
-            self.setRowHidden(
-                row,
-                qmodelindex.parent(),
-                False)
+        with self._batched_view_updates():
+            for i in range(model.columnCount(QModelIndex())):
+                if self.isColumnHidden(i):
+                    self.setColumnHidden(i, False)
+            for qmodelindex in model.get_environment_items_indices():
+                row = qmodelindex.row()
+                qmodelindex_parent = qmodelindex.parent()
+                if self.isRowHidden(row, qmodelindex_parent):
+                    self.setRowHidden(row, qmodelindex_parent, False)
 
 
     ##########################################################################
@@ -7185,12 +7286,12 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
     def get_item_selection_sets_names(self):
         '''
-        Get list of named selection sets.
+        Get a snapshot of named selection sets.
 
         Returns:
-            value (list):
+            value (tuple):
         '''
-        return self._item_selection_sets.keys()
+        return tuple(self._item_selection_sets)
 
 
     def get_item_selection_sets(self):
@@ -7226,12 +7327,12 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
     def get_pass_visibility_sets_names(self):
         '''
-        Get list of named pass visibility sets.
+        Get a snapshot of named pass visibility sets.
 
         Returns:
-            value (list):
+            value (tuple):
         '''
-        return self._pass_visibility_sets.keys()
+        return tuple(self._pass_visibility_sets)
 
 
     def get_pass_visibility_sets(self):
@@ -7280,37 +7381,89 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             selected_qitemselection (QItemSelection):
             deselected_qitemselection (QItemSelection):
         '''
-        # Force delegate widget to update / repaint to look selected
-        for qmodelindex in selected_qitemselection.indexes():
-            item = qmodelindex.internalPointer()
-            # try:
-            item._set_is_selected_in_msrs(True)
-            # except AttributeError:
-            #     continue
-            widget = self.indexWidget(qmodelindex)
-            if not item.is_group_item() and widget:
-                widget.set_is_selected(True)
-                widget.update()
-        # Force delegate widget to update / repaint to look deselected
-        for qmodelindex in deselected_qitemselection.indexes():
-            item = qmodelindex.internalPointer()
-            # try:
-            item._set_is_selected_in_msrs(False)
-            # except AttributeError:
-            #     continue               
-            widget = self.indexWidget(qmodelindex)
-            if not item.is_group_item() and widget:
-                widget.set_is_selected(False)
-                widget.update()
+        self._clear_drag_source_cache()
+
+        # NOTE: Every cell has its own item and delegate widget, so all columns are visited.
+        # Disable viewport updates so all the widgets are only repainted once at the end.
+        viewport = self.viewport()
+        updates_enabled = viewport.updatesEnabled()
+        if updates_enabled:
+            viewport.setUpdatesEnabled(False)
+        try:
+            index_widget = self.indexWidget
+            # Force delegate widget to update / repaint to look selected or deselected
+            for qitemselection, is_selected in (
+                    (selected_qitemselection, True),
+                    (deselected_qitemselection, False)):
+                for qmodelindex in self._iterate_qitemselection_indices(qitemselection):
+                    item = qmodelindex.internalPointer()
+                    # try:
+                    item._set_is_selected_in_msrs(is_selected)
+                    # except AttributeError:
+                    #     continue
+                    widget = index_widget(qmodelindex)
+                    if not item.is_group_item() and widget:
+                        widget.set_is_selected(is_selected)
+                        widget.update()
+        finally:
+            if updates_enabled:
+                viewport.setUpdatesEnabled(True)
+
+
+    def _iterate_qitemselection_indices(self, qitemselection):
+        '''
+        Iterate over every QModelIndex in the ranges of QItemSelection,
+        without first building the full list of indices via indexes().
+        Note: Every column is visited, since each cell has its own item and delegate widget.
+        Note: Like QItemSelection.indexes(), only selectable and enabled indices are included.
+
+        Args:
+            qitemselection (QItemSelection):
+
+        Returns:
+            qmodelindices (generator):
+        '''
+        model = self.model()
+        selectable_and_enabled = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        for qitemselection_range in qitemselection:
+            qmodelindex_parent = qitemselection_range.parent()
+            columns = range(qitemselection_range.left(), qitemselection_range.right() + 1)
+            for row in range(qitemselection_range.top(), qitemselection_range.bottom() + 1):
+                for column in columns:
+                    qmodelindex = model.index(row, column, qmodelindex_parent)
+                    if not qmodelindex.isValid():
+                        continue
+                    if model.flags(qmodelindex) & selectable_and_enabled == selectable_and_enabled:
+                        yield qmodelindex
+
+
+    def _schedule_overlay_update(self):
+        '''
+        Schedule the overlays widget to update once control returns to the event loop,
+        so a burst of update requests only recalculates the overlays once.
+        '''
+        if self._timer_overlay_update.isActive():
+            return
+        self._timer_overlay_update.start()
+
+
+    def _flush_overlay_update(self):
+        '''
+        Perform a previously scheduled update of the overlays widget.
+        '''
+        if self._overlay_widget:
+            self._overlay_widget.update_overlays()
 
 
     def setColumnHidden(self, column, hidden):
         '''
         Reimplemented method to update overlays whenever columns visibility changes.
+        Note: The overlays update is only scheduled, so many consecutive calls
+        (such as from reset or show all) recalculate the overlays once.
         '''
         base_tree_view.BaseTreeView.setColumnHidden(self, column, hidden)
         if self._overlay_widget:
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
 
     def reset_column_sizes(self):
@@ -7336,6 +7489,36 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             model.headerDataChanged.emit(Qt.Horizontal, c, c)
 
 
+    def _emit_data_changed_for_rows(self, qmodelindices):
+        '''
+        Emit dataChanged for all columns of the rows of multiple QModelIndex.
+        Note: Rows are grouped by parent, and each contiguous range of rows emits once.
+
+        Args:
+            qmodelindices (list): of QModelIndex
+        '''
+        model = self.model()
+        column_count = model.columnCount(QModelIndex())
+        rows_by_parent = collections.OrderedDict()
+        for qmodelindex in qmodelindices:
+            qmodelindex_parent = qmodelindex.parent()
+            parent_item_id = qmodelindex_parent.internalId()
+            if parent_item_id not in rows_by_parent:
+                rows_by_parent[parent_item_id] = (qmodelindex_parent, set())
+            rows_by_parent[parent_item_id][1].add(qmodelindex.row())
+        for qmodelindex_parent, rows in rows_by_parent.values():
+            rows = sorted(rows)
+            first_row = last_row = rows[0]
+            for row in rows[1:] + [None]:
+                if row is not None and row == last_row + 1:
+                    last_row = row
+                    continue
+                model.dataChanged.emit(
+                    model.index(first_row, 0, qmodelindex_parent),
+                    model.index(last_row, column_count - 1, qmodelindex_parent))
+                first_row = last_row = row
+
+
     def _set_node_colour(self, render_item, node_colour, column=None):
         '''
         Set node colour for column.
@@ -7445,6 +7628,19 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             lambda x: self.scale_columns(columns=x))
         model.setColumnWidthRequest.connect(self.setColumnWidth)
 
+        self._cell_widgets = dict()
+        model.modelReset.connect(self._cell_widgets.clear)
+        # Qt deletes the editors of removed rows, so unregister them first
+        model.rowsAboutToBeRemoved.connect(self._unregister_cell_widgets_for_rows)
+
+        # Any change to model structure invalidates the source indices of drag
+        self._clear_drag_source_cache()
+        model.layoutChanged.connect(self._clear_drag_source_cache)
+        model.modelReset.connect(self._clear_drag_source_cache)
+        model.rowsInserted.connect(self._clear_drag_source_cache)
+        model.rowsRemoved.connect(self._clear_drag_source_cache)
+        model.rowsMoved.connect(self._clear_drag_source_cache)
+
 
     def mousePressEvent(self, event):
         '''
@@ -7470,8 +7666,8 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             qpoint = self.mapFromGlobal(QCursor.pos())
             qpoint -= QPoint(0, self.header().height())
             qmodelindex_under_mouse = self.indexAt(qpoint)
-            item = qmodelindex_under_mouse.internalPointer()
-            if qmodelindex_under_mouse.isValid() and not item.is_group_item():
+            if qmodelindex_under_mouse.isValid() and \
+                    not qmodelindex_under_mouse.internalPointer().is_group_item():
                 if not self._overlay_widget.get_interactive_source_qmodelindex():
                     self._overlay_widget.set_interactive_source_qmodelindex(qmodelindex_under_mouse)
                 elif not self._overlay_widget.get_interactive_destination_qmodelindex():
@@ -7523,15 +7719,169 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             columns=columns,
             close_existing=close_existing,
             recursive=recursive)
+        # Register the opened editors
+        row = qmodelindex.row()
+        for c in range(self.model().columnCount(QModelIndex())):
+            self._register_cell_widget(qmodelindex.sibling(row, c))
+
+
+    def openPersistentEditor(self, qmodelindex):
+        '''
+        Reimplemented method to register the opened editor widget of cell.
+        '''
+        base_tree_view.BaseTreeView.openPersistentEditor(self, qmodelindex)
+        self._register_cell_widget(qmodelindex)
+
+
+    def closePersistentEditor(self, qmodelindex):
+        '''
+        Reimplemented method to unregister the closed editor widget of cell.
+        '''
+        base_tree_view.BaseTreeView.closePersistentEditor(self, qmodelindex)
+        self._cell_widgets.pop(qmodelindex.internalId(), None)
+
+
+    def _register_cell_widget(self, qmodelindex):
+        '''
+        Register the editor widget (if any) of cell, so all cell widgets can later
+        be visited without looking up the widget of every cell.
+
+        Args:
+            qmodelindex (QModelIndex):
+        '''
+        if not qmodelindex.isValid():
+            return
+        widget = self.indexWidget(qmodelindex)
+        if widget:
+            self._cell_widgets[qmodelindex.internalId()] = widget
+        else:
+            self._cell_widgets.pop(qmodelindex.internalId(), None)
+
+
+    def _unregister_cell_widgets_for_rows(self, qmodelindex_parent, first, last):
+        '''
+        Unregister the editor widgets of cells of rows about to be removed,
+        including the cells of all descendant rows.
+
+        Args:
+            qmodelindex_parent (QModelIndex):
+            first (int):
+            last (int):
+        '''
+        if not self._cell_widgets:
+            return
+        model = self.model()
+        column_count = model.columnCount(qmodelindex_parent)
+        for row in range(first, last + 1):
+            for c in range(column_count):
+                qmodelindex = model.index(row, c, qmodelindex_parent)
+                if qmodelindex.isValid():
+                    self._cell_widgets.pop(qmodelindex.internalId(), None)
+            qmodelindex = model.index(row, 0, qmodelindex_parent)
+            child_count = model.rowCount(qmodelindex)
+            if child_count:
+                self._unregister_cell_widgets_for_rows(qmodelindex, 0, child_count - 1)
+
+
+    def _set_cell_widgets_interactive(self, interactive=True):
+        '''
+        Set whether all registered cell widgets receive mouse events and tracking.
+        Note: Widgets of removed rows are already unregistered on rowsAboutToBeRemoved,
+        so this only guards against any widget otherwise deleted by Qt.
+
+        Args:
+            interactive (bool):
+        '''
+        for key, widget in list(self._cell_widgets.items()):
+            try:
+                widget.setAttribute(Qt.WA_TransparentForMouseEvents, not interactive)
+                widget.setMouseTracking(interactive)
+            except RuntimeError:
+                self._cell_widgets.pop(key, None)
     
     
-    def _select_row_from_qmodel_index(self, qmodelindex):
+    def _move_child_rows(
+            self,
+            qmodelindex_parent,
+            rows_items,
+            destination_item,
+            qmodelindex_destination,
+            destination_row):
+        '''
+        Move child rows of one parent to another parent at destination row, with
+        one beginMoveRows / endMoveRows per contiguous range of source rows.
+        Note: Moved rows keep their existing relative order at destination.
+
+        Args:
+            qmodelindex_parent (QModelIndex): parent of rows to move
+            rows_items (list): of (row, item) tuples of child items to move
+            destination_item (object): the new parent item (must differ from source parent)
+            qmodelindex_destination (QModelIndex): the new parent index
+            destination_row (int):
+        '''
+        model = self.model()
+        ranges = list()
+        for row, item in sorted(rows_items, key=lambda x: x[0]):
+            if ranges and row == ranges[-1][-1][0] + 1:
+                ranges[-1].append((row, item))
+            else:
+                ranges.append([(row, item)])
+        # Move last range first, so rows of earlier ranges remain valid
+        for _rows_items in reversed(ranges):
+            first_row, last_row = _rows_items[0][0], _rows_items[-1][0]
+            parent_item = _rows_items[0][1].parent()
+            model.beginMoveRows(
+                qmodelindex_parent,
+                first_row,
+                last_row,
+                qmodelindex_destination,
+                destination_row)
+            for row in range(last_row, first_row - 1, -1):
+                parent_item.remove_child(row)
+            for offset, (row, item) in enumerate(_rows_items):
+                destination_item.insert_child(destination_row + offset, item)
+            model.endMoveRows()
+
+
+    def _build_merged_selection(self, qmodelindices):
+        '''
+        Build a single QItemSelection from a list of QModelIndex, where contiguous
+        rows of the same parent and column are merged into one QItemSelectionRange.
+
+        Args:
+            qmodelindices (list): of QModelIndex
+
+        Returns:
+            selection (QItemSelection):
+        '''
+        organized_indices = collections.OrderedDict()
+        for qmodelindex in qmodelindices:
+            key = (qmodelindex.parent().internalId(), qmodelindex.column())
+            if key not in organized_indices:
+                organized_indices[key] = list()
+            organized_indices[key].append(qmodelindex)
         selection = QItemSelection()
+        for indices in organized_indices.values():
+            indices.sort(key=lambda x: x.row())
+            first_qmodelindex = last_qmodelindex = indices[0]
+            for qmodelindex in indices[1:]:
+                if qmodelindex.row() == last_qmodelindex.row() + 1:
+                    last_qmodelindex = qmodelindex
+                    continue
+                selection.append(QItemSelectionRange(first_qmodelindex, last_qmodelindex))
+                first_qmodelindex = last_qmodelindex = qmodelindex
+            selection.append(QItemSelectionRange(first_qmodelindex, last_qmodelindex))
+        return selection
+
+
+    def _select_row_from_qmodel_index(self, qmodelindex):
         model = qmodelindex.model()
         column_count = model.columnCount(QModelIndex())
-        for c in range(column_count):
-            qmodelindex_sibling = qmodelindex.sibling(qmodelindex.row(), c)
-            selection.append(QItemSelectionRange(qmodelindex_sibling))
+        row = qmodelindex.row()
+        # A single range covering every column of row
+        selection = QItemSelection(
+            qmodelindex.sibling(row, 0),
+            qmodelindex.sibling(row, column_count - 1))
         selection_model = self.selectionModel()
         selection_model.select(selection, QItemSelectionModel.ClearAndSelect)
 
@@ -7561,12 +7911,21 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         selection = selection or self.selectedIndexes()
 
-        for item in self.get_selected_items(selection=selection):
+        # Gather the environment and pass for env items of selection once, to reuse after dialog.
+        # NOTE: Every column is kept, since each pass for env item has its own WAIT on.
+        selected_indices_items = list()
+        for qmodelindex in selection:
+            if not qmodelindex.isValid():
+                continue
+            item = qmodelindex.internalPointer()
             if item.is_environment_item() or item.is_pass_for_env_item():
-                if any([item.get_wait_on(), item.get_wait_on_plow_ids()]):
-                    wait_on_multi_shot = item.get_wait_on()
-                    wait_on_plow_ids = item.get_wait_on_plow_ids()
-                    break
+                selected_indices_items.append((qmodelindex, item))
+
+        for qmodelindex, item in selected_indices_items:
+            if item.get_wait_on() or item.get_wait_on_plow_ids():
+                wait_on_multi_shot = item.get_wait_on()
+                wait_on_plow_ids = item.get_wait_on_plow_ids()
+                break
 
         version = model.get_multi_shot_render_submitter_version()
 
@@ -7583,32 +7942,35 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         if dialog.exec_() == QDialog.Rejected:
             return
 
-        wait_on_multi_shot = dialog.get_wait_on_multi_shot_items_uuids() or list()
+        wait_on_multi_shot = list(dialog.get_wait_on_multi_shot_items_uuids() or list())
+        wait_on_multi_shot_uuids = set(wait_on_multi_shot)
         wait_on_plow_ids = dialog.get_wait_on_plow_ids() or list()
 
-        update_count = 0
-        for i, qmodelindex in enumerate(selection):
-            if not qmodelindex.isValid():
-                continue
-            item = qmodelindex.internalPointer()
-            if not any([item.is_environment_item(), item.is_pass_for_env_item()]):
-                continue
+        changed_qmodelindices = list()
+        for qmodelindex, item in selected_indices_items:
             current_wait_on_multi_shot = item.get_wait_on()
             current_wait_on_plow_ids = item.get_wait_on_plow_ids()
             # NOTE: Avoid setting self depedency
             identity_id = item.get_identity_id()
-            if identity_id in wait_on_multi_shot:
-                wait_on_multi_shot.pop(identity_id)
-            item.set_wait_on(wait_on_multi_shot)
+            if identity_id in wait_on_multi_shot_uuids:
+                item_wait_on_multi_shot = [
+                    uuid for uuid in wait_on_multi_shot if uuid != identity_id]
+            else:
+                item_wait_on_multi_shot = wait_on_multi_shot
+            item.set_wait_on(item_wait_on_multi_shot)
             item.set_wait_on_plow_ids(wait_on_plow_ids)
-            wait_on_multi_shot_changed = current_wait_on_multi_shot != wait_on_multi_shot
+            wait_on_multi_shot_changed = current_wait_on_multi_shot != item_wait_on_multi_shot
             wait_on_plow_ids_changed = current_wait_on_plow_ids != wait_on_plow_ids
-            if any([wait_on_multi_shot_changed, wait_on_plow_ids_changed]):
-                model.dataChanged.emit(qmodelindex, qmodelindex)
-                update_count += 1
+            if wait_on_multi_shot_changed or wait_on_plow_ids_changed:
+                changed_qmodelindices.append(qmodelindex)
+
+        # Emit dataChanged once per contiguous range of changed rows
+        update_count = len(changed_qmodelindices)
+        if update_count:
+            self._emit_data_changed_for_rows(changed_qmodelindices)
 
         if update_count and self._overlay_widget:
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
         return update_count
 
@@ -7634,16 +7996,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         model = self.model()
 
-        column_count = model.columnCount(QModelIndex())
-        for qmodelindex_env in model.get_environment_items_indices():
-            if not qmodelindex_env.isValid():
-                continue
-            for c in range(column_count):
-                qmodelindex_cell = qmodelindex_env.sibling(qmodelindex_env.row(), c)
-                widget = self.indexWidget(qmodelindex_cell)
-                if widget:
-                    widget.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-                    widget.setMouseTracking(False)
+        self._set_cell_widgets_interactive(False)
 
         cursor = QCursor(QPixmap(constants.WAIT_ICON_PATH))
         QApplication.setOverrideCursor(cursor)
@@ -7653,7 +8006,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         model._in_wait_on_interactive_mode = True
 
         self._overlay_widget.set_draw_all_interactive_overlays(True)
-        self._overlay_widget.update_overlays()
+        self._schedule_overlay_update()
 
 
     def exit_wait_on_interactive(self):
@@ -7673,19 +8026,10 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         self._in_wait_on_interactive_mode = False
         model._in_wait_on_interactive_mode = False
 
-        column_count = model.columnCount(QModelIndex())
-        for qmodelindex_env in model.get_environment_items_indices():
-            if not qmodelindex_env.isValid():
-                continue
-            for c in range(column_count):
-                qmodelindex_cell = qmodelindex_env.sibling(qmodelindex_env.row(), c)
-                widget = self.indexWidget(qmodelindex_cell)
-                if widget:
-                    widget.setAttribute(Qt.WA_TransparentForMouseEvents, False)
-                    widget.setMouseTracking(True)
+        self._set_cell_widgets_interactive(True)
 
         self._overlay_widget.set_draw_all_interactive_overlays(False)
-        self._overlay_widget.update_overlays()
+        self._schedule_overlay_update()
 
         self.updateDetailsPanel.emit(False)
 
@@ -7705,7 +8049,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         source_qmodelindex = self._overlay_widget.get_interactive_source_qmodelindex()
         destination_qmodelindex = self._overlay_widget.get_interactive_destination_qmodelindex()
-        if all([source_qmodelindex, destination_qmodelindex]) and \
+        if source_qmodelindex and destination_qmodelindex and \
                 source_qmodelindex != destination_qmodelindex:
             destination_item = destination_qmodelindex.internalPointer()
             identity_id = destination_item.get_identity_id()
@@ -7760,9 +8104,8 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         qpoint = self.mapFromGlobal(QCursor.pos())
         qpoint -= QPoint(0, self.header().height())
         qmodelindex_under_mouse = self.indexAt(qpoint)
-        is_valid = qmodelindex_under_mouse.isValid()
-        item = qmodelindex_under_mouse.internalPointer()
-        if is_valid and not item.is_group_item():
+        if qmodelindex_under_mouse.isValid() and \
+                not qmodelindex_under_mouse.internalPointer().is_group_item():
             self._overlay_widget.set_interactive_item_current_qmodelindex(qmodelindex_under_mouse)
         else:
             self._overlay_widget.set_interactive_item_current_qmodelindex(None)
@@ -7776,7 +8119,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         '''
         base_tree_view.BaseTreeView.resizeEvent(self, event)
         if self._overlay_widget:
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
 
     ##########################################################################
@@ -7813,6 +8156,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         '''
         Get an organized mapping of Environment indices related to items to perform operation on.
         Note: Mapped by parent internal id, then row number, mapped to QModelIndex.
+        Note: Only valid column 0 indices are collected, so callers need not filter again.
 
         Args:
             selection (list): of QModelIndex
@@ -7824,7 +8168,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             selection = list()
         selection = selection or self.selectedIndexes()
         selection_count = 0
-        organized_indices = collections.OrderedDict()
+        organized_indices = INSERTION_ORDERED_DICT()
         for i, qmodelindex in enumerate(selection):
             if not qmodelindex.isValid():
                 continue
@@ -7832,9 +8176,8 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             row = qmodelindex.row()
             parent_item_id = qmodelindex.parent().internalId()
-            if not parent_item_id in organized_indices.keys():
-                organized_indices[parent_item_id] = collections.OrderedDict()
-            organized_indices[parent_item_id][row] = qmodelindex
+            organized_indices.setdefault(
+                parent_item_id, INSERTION_ORDERED_DICT())[row] = qmodelindex
             selection_count += 1
         return organized_indices, selection_count
 
@@ -7853,8 +8196,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         '''
         areas = mime_data.text()
         # Split on line break or comma
-        import re
-        areas_list = re.split('\n|,', areas)
+        areas_list = MIME_TEXT_SPLIT_REGEX.split(areas)
         environments = list()
         for area in areas_list:
             area = str(area).replace(' ', str())
@@ -7877,12 +8219,11 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         model = self.model()
         item_full_names = mime_data.text()
         # Split on line break or comma
-        import re
-        item_full_names_list = re.split('\n|,', item_full_names)
+        item_full_names_list = MIME_TEXT_SPLIT_REGEX.split(item_full_names)
+        render_item_object = model.get_render_item_object()
         render_node_names = list()
         for item_full_name in item_full_names_list:
             item_full_name = str(item_full_name).replace(' ', str())
-            render_item_object = model.get_render_item_object()
             render_item = render_item_object(
                 item_full_name=item_full_name)
             render_node = render_item.get_node_in_host_app()
@@ -7891,10 +8232,38 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         return render_node_names
 
 
+    def _classify_mime(self, mime_data):
+        '''
+        Classify text mime data of external drag as environments or render node names.
+        Note: The classification is cached for the mime text, so is only parsed once per drag.
+
+        Args:
+            mime_data (QMimeData):
+
+        Returns:
+            mime_kind, payload (tuple): mime kind is either "areas", "render_nodes" or None
+        '''
+        if not mime_data.hasText() or hasattr(mime_data, 'from_msrs'):
+            return None, list()
+        text = mime_data.text()
+        if self._mime_classification_cache and self._mime_classification_cache[0] == text:
+            return self._mime_classification_cache[1]
+        result = (None, list())
+        environments = self._gather_environments_from_mime(mime_data)
+        if environments:
+            result = ('areas', environments)
+        elif self.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER:
+            render_node_names = self._gather_render_node_names_from_mime(mime_data)
+            if render_node_names:
+                result = ('render_nodes', render_node_names)
+        self._mime_classification_cache = (text, result)
+        return result
+
+
     def _gather_source_items_to_drag(self, event):
         '''
         Get an organized mapping of Environment and Group indices related to items to drag and drop.
-        Note: Mapped by parent internal id, then row number, mapped to QModelIndex.
+        Note: Mapped by parent internal id, to list of row number and QModelIndex pairs in selection order.
 
         Args:
             event (QtCore.QEvent):
@@ -7902,9 +8271,14 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         Returns:
             organized_indices, selection_count (tuple):
         '''
+        # NOTE: Drag move events fire continuously, so only walk the selection once per drag.
+        # The source items are the selection of this view, so are gathered on drag enter and
+        # reused by every following drag move and the drop, until selection or model changes.
+        if self._drag_source_cache is not None:
+            return self._drag_source_cache
         selection = self.selectedIndexes()
         all_items_must_be = None
-        organized_indices = collections.OrderedDict()
+        organized_indices = INSERTION_ORDERED_DICT()
         selection_count = 0
         for i, qmodelindex in enumerate(selection):
             if not qmodelindex.isValid():
@@ -7925,13 +8299,19 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 continue
             row = qmodelindex.row()
             parent_item_id = qmodelindex.parent().internalId()
-            if not parent_item_id in organized_indices.keys():
-                organized_indices[parent_item_id] = collections.OrderedDict()
-            organized_indices[parent_item_id][row] = qmodelindex
+            organized_indices.setdefault(parent_item_id, list()).append((row, qmodelindex))
             selection_count += 1
+        self._drag_source_cache = (organized_indices, selection_count)
         return organized_indices, selection_count
 
 
+    def _clear_drag_source_cache(self, *args):
+        '''
+        Clear the cached source indices to drag, because drag ended or selection or model changed.
+        '''
+        self._drag_source_cache = None
+
+
     def dragEnterEvent(self, event):
         '''
         Drag enter event.
@@ -7939,20 +8319,16 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         Args:
             event (QtCore.QEvent):
         '''
-        # Check if dragging from other external tool a string of environments
-        has_areas = False
-        has_render_nodes = False
-        mime_data = event.mimeData()
-        if mime_data.hasText() and not hasattr(mime_data, 'from_msrs'):
-            environments = self._gather_environments_from_mime(mime_data)
-            has_areas = bool(environments)
-            if not has_areas and constants.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER:
-                render_node_names = self._gather_render_node_names_from_mime(mime_data)
-                has_render_nodes = bool(render_node_names)
-            if any([has_areas, has_render_nodes]):
-                QTreeView.dragEnterEvent(self, event)
-                event.acceptProposedAction()
-                return
+        # New drag operation, so gather the source items and classify mime again
+        self._clear_drag_source_cache()
+        self._mime_classification_cache = None
+
+        # Check if dragging from other external tool a string of environments or render nodes
+        mime_kind, payload = self._classify_mime(event.mimeData())
+        if mime_kind:
+            QTreeView.dragEnterEvent(self, event)
+            event.acceptProposedAction()
+            return
 
         # Must have indices to drag move!ki
         organized_indices, selection_count = self._gather_source_items_to_drag(event)
@@ -7972,9 +8348,26 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             event (QtCore.QEvent):
         '''
         self._rect_tmp = None
+        self._clear_drag_source_cache()
+        self._mime_classification_cache = None
         base_tree_view.BaseTreeView.dragLeaveEvent(self, event)
 
 
+    def _set_draw_in_between(self, value):
+        '''
+        Set the position to draw the in between drop hint at, and only
+        update the view when the position actually changed.
+        Note: Drag move events fire on every cursor move, so avoids repainting continuously.
+
+        Args:
+            value (int): top of QModelIndex rect, or None to not draw in between hint
+        '''
+        if getattr(self, '_draw_in_between', None) == value:
+            return
+        self._draw_in_between = value
+        self.update()
+
+
     def dragMoveEvent(self, event):
         '''
         Drag move event.
@@ -7982,23 +8375,17 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         Args:
             event (QtCore.QEvent):
         '''
-        # Check if dragging from other external tool a string of environments
-        has_areas = False
-        has_render_nodes = False
-        environments = list()
-        render_node_names = list()
-        mime_data = event.mimeData()
-        if mime_data.hasText() and not hasattr(mime_data, 'from_msrs'):
-            environments = self._gather_environments_from_mime(mime_data)
-            has_areas = bool(environments)
-            if not has_areas and constants.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER:
-                render_node_names = self._gather_render_node_names_from_mime(mime_data)
-                has_render_nodes = bool(render_node_names)
+        # Check if dragging from other external tool a string of environments or render nodes
+        mime_kind, payload = self._classify_mime(event.mimeData())
+        has_areas = mime_kind == 'areas'
+        has_render_nodes = mime_kind == 'render_nodes'
+        environments = payload if has_areas else list()
+        render_node_names = payload if has_render_nodes else list()
 
         # Must have indices to drag move
         organized_indices = dict()
         selection_count = 0
-        if not any([has_areas, has_render_nodes]):
+        if not mime_kind:
             organized_indices, selection_count = self._gather_source_items_to_drag(event)
             if not organized_indices:
                 event.ignore()
@@ -8012,24 +8399,21 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             if is_between:
                 rect = self.visualRect(destination_qmodelindex)
                 msg = 'Adding {} Environments'.format(len(environments))
-                self._draw_in_between = rect.top()
-                self.update()
+                self._set_draw_in_between(rect.top())
                 QTreeView.dragMoveEvent(self, event)
                 event.acceptProposedAction()
                 return
             # Dragging new environments into Multi Shot view at end from string mime data
             elif not destination_qmodelindex.isValid():
                 msg = 'Adding {} Environments'.format(len(environments))
-                self._draw_in_between = None
-                self.update()
+                self._set_draw_in_between(None)
                 QTreeView.dragMoveEvent(self, event)
                 event.acceptProposedAction()
                 return
             # Dragging new environments into Multi Shot view on to group from string mime data
             elif destination_node_type and 'GroupItem' in destination_node_type:
                 msg = 'Adding {} Environments Into Group'.format(len(environments))
-                self._draw_in_between = None
-                self.update()
+                self._set_draw_in_between(None)
                 QTreeView.dragMoveEvent(self, event)
                 event.acceptProposedAction()
                 return
@@ -8037,16 +8421,13 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
             return
         elif has_render_nodes:
             msg = 'Adding {} Render Nodes'.format(len(render_node_names))
-            self._draw_in_between = None
-            self.update()
+            self._set_draw_in_between(None)
             QTreeView.dragMoveEvent(self, event)
             event.acceptProposedAction()
             return
 
-        parent_item_id = organized_indices.keys()[0]
-        rows = organized_indices[parent_item_id].keys()
-        row = rows[-1]
-        source_qmodelindex = organized_indices[parent_item_id][row]
+        rows = organized_indices[next(iter(organized_indices))]
+        row, source_qmodelindex = rows[-1]
         source_item = source_qmodelindex.internalPointer()
         source_node_type = source_item.get_node_type()
 
@@ -8060,8 +8441,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         # Dragging GroupItem between two indices, where parent isn't the root of view
         if is_between and 'GroupItem' in source_node_type and 'Root' not in parent_node_type:
             msg = 'Groups Can Only Be Dragged To Root Of Tree'
-            self._draw_in_between = None
-            self.update()
+            self._set_draw_in_between(None)
             event.ignore()
             return
 
@@ -8069,8 +8449,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         if is_between:
             rect = self.visualRect(destination_qmodelindex)
             msg = 'Rearranging {} {}/s Items'.format(selection_count, source_node_type)
-            self._draw_in_between = rect.top()
-            self.update()
+            self._set_draw_in_between(rect.top())
             QTreeView.dragMoveEvent(self, event)
             event.acceptProposedAction()
             return
@@ -8078,8 +8457,7 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         # Dragging to non index, so at end of view
         if not destination_qmodelindex.isValid():
             msg = 'Dragging {} {}/s Items'.format(selection_count, source_node_type)
-            self._draw_in_between = None
-            self.update()
+            self._set_draw_in_between(None)
             QTreeView.dragMoveEvent(self, event)
             event.acceptProposedAction()
             return
@@ -8092,15 +8470,13 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
                 selection_count,
                 source_node_type,
                 destination_node_type)
-            self._draw_in_between = None
-            self.update()
+            self._set_draw_in_between(None)
             QTreeView.dragMoveEvent(self, event)
             event.acceptProposedAction()
             return
 
         msg = 'Image/s Can Only Be Rearranged By Dropping In Between'
-        self._draw_in_between = None
-        self.update()
+        self._set_draw_in_between(None)
         event.ignore()
 
 
@@ -8116,23 +8492,22 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         model = self.model()
 
-        # Check if dragging from other external tool a string of environments
-        has_areas = False
-        has_render_nodes = False
-        environments = list()
-        render_node_names = list()
-        mime_data = event.mimeData()
-        if mime_data.hasText() and not hasattr(mime_data, 'from_msrs'):
-            environments = self._gather_environments_from_mime(mime_data)
-            has_areas = bool(environments)
-            if not has_areas and constants.ALLOW_TOGGLE_ENABLED_FROM_COLUMN_HEADER:
-                render_node_names = self._gather_render_node_names_from_mime(mime_data)
-                has_render_nodes = bool(render_node_names)
-
-        # Must have indices to drag move
+        # Check if dragging from other external tool a string of environments or render nodes
+        mime_kind, payload = self._classify_mime(event.mimeData())
+        # Drag operation is ending, so dont keep mime classification
+        self._mime_classification_cache = None
+        has_areas = mime_kind == 'areas'
+        has_render_nodes = mime_kind == 'render_nodes'
+        environments = payload if has_areas else list()
+        render_node_names = payload if has_render_nodes else list()
+
+        # Must have indices to drag move.
+        # NOTE: Reuses the source indices already gathered by preceding dragMoveEvent.
         organized_indices = dict()
-        if not any([has_areas, has_render_nodes]):
+        if not mime_kind:
             organized_indices, selection_count = self._gather_source_items_to_drag(event)
+            # Drag operation is ending, so dont keep source indices
+            self._clear_drag_source_cache()
             if not organized_indices:
                 event.ignore()
                 self.update()
@@ -8143,31 +8518,36 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
         result  = self._get_destination_item_and_index_for_event(event)
         destination_item, destination_node_type, destination_qmodelindex, is_between = result
 
-        # Is dropping at root of model and next index
-        if not destination_qmodelindex.isValid():
-            destination_qmodelindex = QModelIndex()
-            destination_row = model.rowCount(destination_qmodelindex)
-        else:
-            destination_row = destination_qmodelindex.row()
+        # NOTE: Each branch below assigns the destination row exactly once
+        is_valid = destination_qmodelindex.isValid()
 
         # Is dragging between two indices
         if is_between:
-            # Has no destination item or dragging at root of model
-            if not destination_item or not destination_item.parent():
-                destination_item = model.get_root_node()
             # Dragging at lower level
-            else:
+            if destination_item and destination_item.parent():
                 destination_row = destination_qmodelindex.row()
                 destination_qmodelindex = destination_qmodelindex.parent()
                 destination_item = destination_item.parent()
+            # Has no destination item or dragging at root of model
+            else:
+                destination_item = model.get_root_node()
+                if is_valid:
+                    destination_row = destination_qmodelindex.row()
+                # Is dropping at root of model and next index
+                else:
+                    destination_qmodelindex = QModelIndex()
+                    destination_row = model.rowCount(destination_qmodelindex)
         # Dragging one item on to another
         else:
             if not destination_item:
                 destination_item = model.get_root_node()
-
-        # Parent to next index of target Groupitem
-        if destination_node_type == 'GroupItem' and not is_between:
-            destination_row = model.rowCount(destination_qmodelindex)
+            if not is_valid:
+                destination_qmodelindex = QModelIndex()
+            # Parent to next index of target Groupitem, or is dropping at root of model and next index
+            if destination_node_type == 'GroupItem' or not is_valid:
+                destination_row = model.rowCount(destination_qmodelindex)
+            else:
+                destination_row = destination_qmodelindex.row()
 
         if has_areas:
             model.add_environments(
@@ -8194,82 +8574,92 @@ class MultiShotRenderView(base_tree_view.BaseTreeView):
 
         ######################################################################
         # Unparent source items and remove rows for drag and drop operation
+        # NOTE: The viewport and overlays are only updated once after all rows are moved.
+
+        with self._batched_view_updates():
+            items_to_insert = list()
+            for rows in organized_indices.values():
+                # Group the descending rows into contiguous runs, so each run is removed at once.
+                # NOTE: The cached source items were already cleared, so can sort in place.
+                rows.sort(reverse=True)
+                runs = list()
+                for row, source_qmodelindex in rows:
+                    if not source_qmodelindex.isValid():
+                        continue
+                    if source_qmodelindex.column() != 0:
+                        continue
+                    item = source_qmodelindex.internalPointer()
+                    row = source_qmodelindex.row()
 
-        items_to_insert = list()
-        for parent_item_id in organized_indices.keys():
-            rows = reversed(sorted(organized_indices[parent_item_id].keys()))
-            for row in rows:
-                source_qmodelindex = organized_indices[parent_item_id][row]
-                if not source_qmodelindex.isValid():
-                    continue
-                if source_qmodelindex.column() != 0:
-                    continue
-                qmodelindex_parent = source_qmodelindex.parent()
-                item = source_qmodelindex.internalPointer()
-                row = source_qmodelindex.row()
-
-                parent_item = item.parent()
-                if not parent_item:
-                    continue
-
-                # Remove the remove row and item
-                row_count = model.rowCount(qmodelindex_parent)
-                if row > row_count:
-                    remove_row = row_count
-                else:
-                    remove_row = row
-
-                ##############################################################
-                # Remove each row in reverse order to start with.
-                # Will later insert the rows at destination, to avoid complex index issues.
-
-                model.beginRemoveRows(qmodelindex_parent, remove_row, remove_row)
-                parent_item.remove_child(remove_row)
-                model.endRemoveRows()
-
-                items_to_insert.append(item)
+                    parent_item = item.parent()
+                    if not parent_item:
+                        continue
 
-                ##############################################################
-                # Close existing editor
+                    if runs and runs[-1][2][-1][0] == row + 1:
+                        runs[-1][2].append((row, item))
+                    else:
+                        runs.append((source_qmodelindex.parent(), parent_item, [(row, item)]))
 
-                qmodelindex = model.index(remove_row, 0, qmodelindex_parent)
-                model.modify_persistent_editors_recursive(
-                    qmodelindex,
-                    open_editor=False,
-                    recursive=True,
-                    auto_expand=False)
+                for qmodelindex_parent, parent_item, rows_items in runs:
+                    first_row = rows_items[-1][0]
+                    last_row = rows_items[0][0]
 
-        ######################################################################
-        # Parent items to new destination items, and insert rows again
+                    ##########################################################
+                    # Remove each run of rows in reverse order to start with.
+                    # Will later insert the rows at destination, to avoid complex index issues.
 
-        model.beginInsertRows(
-            destination_qmodelindex,
-            destination_row,
-            destination_row + len(items_to_insert) - 1)
-        select_by_uuids = list()
-        for item in items_to_insert:
-            destination_item.insert_child(destination_row, item)
-            select_by_uuids.append(item.get_identity_id())
-        model.endInsertRows()
+                    model.beginRemoveRows(qmodelindex_parent, first_row, last_row)
+                    for row, item in rows_items:
+                        parent_item.remove_child(row)
+                        items_to_insert.append(item)
+                    model.endRemoveRows()
 
-        recursive = destination_item.is_group_item() or destination_item.is_root()
+                    ##########################################################
+                    # Close existing editors of row now in place of removed rows.
+                    # NOTE: This is the surviving sibling (if any) which moved up into
+                    # first_row, so its editors are closed (recursively). Only that one
+                    # row is swept per run, rather than every row of parent.
 
-        model.modify_persistent_editors_recursive(
-            destination_qmodelindex.parent(),
-            open_editor=True,
-            recursive=recursive,
-            auto_expand=True)
+                    qmodelindex = model.index(first_row, 0, qmodelindex_parent)
+                    model.modify_persistent_editors_recursive(
+                        qmodelindex,
+                        open_editor=False,
+                        recursive=True,
+                        auto_expand=False)
 
-        # Reselect the Environments that were rearranged, thereby creating new QModelIndices
-        self.select_by_identity_uids(select_by_uuids)
+            ##################################################################
+            # Parent items to new destination items, and insert rows again
+
+            model.beginInsertRows(
+                destination_qmodelindex,
+                destination_row,
+                destination_row + len(items_to_insert) - 1)
+            select_by_uuids = list()
+            for item in items_to_insert:
+                destination_item.insert_child(destination_row, item)
+                select_by_uuids.append(item.get_identity_id())
+            model.endInsertRows()
+
+            recursive = destination_item.is_group_item() or destination_item.is_root()
+
+            model.modify_persistent_editors_recursive(
+                destination_qmodelindex.parent(),
+                open_editor=True,
+                recursive=recursive,
+                auto_expand=True)
+
+            # Environments might have changed order so update cached indices.
+            # NOTE: Updated before reselecting, so the UUID lookups are already current,
+            # and are not rebuilt again as stale while selecting.
+            model._update_environments_indices()
 
-        # Environments might have changed order so update cached indices
-        model._update_environments_indices()
+            # Reselect the Environments that were rearranged, thereby creating new QModelIndices
+            self.select_by_identity_uids(select_by_uuids)
 
         self.update()
 
         if self._overlay_widget:
-            self._overlay_widget.update_overlays()
+            self._schedule_overlay_update()
 
 
 ##############################################################################
@@ -8286,6 +8676,13 @@ class MultiShotHeaderView(QHeaderView):
         constants (Constants): optionally pass a shared instance of Constants module
     '''
 
+    # Colours and pens for paintSection, constructed once rather than per paint
+    BACKGROUND_QCOLOUR = QColor(*constants.HEADER_BACKGROUND_COLOUR)
+    NOT_QUEUED_QCOLOUR = QColor(*constants.CELL_ENABLED_NOT_QUEUED_COLOUR)
+    DISABLED_HINT_PEN = QPen(QColor(200, 30, 30))
+    DISABLED_HINT_PEN.setWidth(2)
+    LABEL_PEN = QPen(QColor(0, 0, 0))
+
     def __init__(
             self,
             orientation=Qt.Horizontal,
@@ -8302,6 +8699,15 @@ class MultiShotHeaderView(QHeaderView):
 
         self._draw_node_type_icons = False
 
+        # QColor of each node and state colour value, so only constructed once per colour
+        self._paint_colours_cache = dict()
+        # Outline QPen of each node colour by rgba value
+        self._outline_pens_cache = dict()
+        # Reusable sub rectangles of section for paintSection
+        self._rect_new_area = QRect()
+        self._rect_node_colour = QRect()
+        self._rect_disabled_hint = QRect()
+
         import Qt as qt_shim
         if any([qt_shim.IsPySide2, qt_shim.IsPyQt5]):
             self.setSectionsClickable(True)
@@ -8417,18 +8823,22 @@ class MultiShotHeaderView(QHeaderView):
         model = self.model()
         view = self.parent()
         selection_model = view.selectionModel()
-        previous = selection_model.selection()
         modifiers = QApplication.keyboardModifiers()
         add = modifiers == Qt.ShiftModifier or modifiers == Qt.ControlModifier
-        if not add:
-            selection_model.clearSelection()
+        qmodelindices = list()
         for qmodelindex in model.get_environment_items_indices():
             if not qmodelindex.isValid():
                 continue
             qmodelindex_column = qmodelindex.sibling(qmodelindex.row(), section)
             if not qmodelindex_column.isValid():
                 continue
-            selection_model.select(qmodelindex_column, QItemSelectionModel.Select)
+            qmodelindices.append(qmodelindex_column)
+        # Select all cells of column in one request, so selectionChanged is only emitted once
+        selection = view._build_merged_selection(qmodelindices)
+        if add:
+            selection_model.select(selection, QItemSelectionModel.Select)
+        else:
+            selection_model.select(selection, QItemSelectionModel.ClearAndSelect)
 
 
     def mouseReleaseEvent(self, event):
@@ -8443,6 +8853,53 @@ class MultiShotHeaderView(QHeaderView):
         QHeaderView.mouseReleaseEvent(self, event)
 
 
+    def _get_paint_colour(self, colour, normalized=False):
+        '''
+        Get a cached QColor for colour value of render item or view.
+
+        Args:
+            colour (str): colour name, or list of rgb values
+            normalized (bool): whether rgb values are floats between 0 and 1
+
+        Returns:
+            colour (QColor):
+        '''
+        if isinstance(colour, basestring):
+            key = colour
+        else:
+            key = (tuple(colour), normalized)
+        qcolour = self._paint_colours_cache.get(key)
+        if qcolour is None:
+            if isinstance(colour, basestring):
+                qcolour = QColor(colour)
+            elif normalized:
+                qcolour = QColor.fromRgbF(*(list(colour) + [1.0]))
+            else:
+                qcolour = QColor(*colour)
+            self._paint_colours_cache[key] = qcolour
+        return qcolour
+
+
+    def _get_outline_pen(self, qcolour):
+        '''
+        Get a cached outline QPen for node QColor.
+
+        Args:
+            qcolour (QColor):
+
+        Returns:
+            pen (QPen):
+        '''
+        rgba = qcolour.rgba()
+        pen = self._outline_pens_cache.get(rgba)
+        if pen is None:
+            pen = QPen()
+            pen.setWidth(1)
+            pen.setColor(qcolour)
+            self._outline_pens_cache[rgba] = pen
+        return pen
+
+
     def paintSection(self, painter, rect, column):
         '''
         Paint a specific column header.
@@ -8452,10 +8909,11 @@ class MultiShotHeaderView(QHeaderView):
             rect (QRect):
             column (int):
         '''
-        # painter.setRenderHint(QPainter.HighQualityAntialiasing)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(rect, self.BACKGROUND_QCOLOUR)
 
-        painter.fillRect(rect, QColor(*constants.HEADER_BACKGROUND_COLOUR))
+        # Section is entirely outside the region being repainted
+        if painter.hasClipping() and not painter.clipRegion().intersects(rect):
+            return
 
         if column == 0:
             #QHeaderView.paintSection(self, painter, rect, column)
@@ -8475,55 +8933,51 @@ class MultiShotHeaderView(QHeaderView):
         #     QHeaderView.paintSection(self, painter, rect, column)
         #     return
 
-        rect_new_area = rect.adjusted(2, 2, -2, -2)
+        rect_new_area = self._rect_new_area
+        rect_new_area.setRect(rect.x() + 2, rect.y() + 2, rect.width() - 4, rect.height() - 4)
 
         if renderable_count_for_render_node:
             render_node_colour = view.get_render_item_colour()
-            state_colour = QColor(*render_node_colour) #constants.HEADER_RENDERABLE_COLOUR)
+            state_colour = self._get_paint_colour(render_node_colour) #constants.HEADER_RENDERABLE_COLOUR)
         else:
-            state_colour = QColor(*constants.CELL_ENABLED_NOT_QUEUED_COLOUR)
+            state_colour = self.NOT_QUEUED_QCOLOUR
         painter.fillRect(rect_new_area, state_colour)
 
         # Draw node colour
         if self._draw_header_node_colour and node_colour:
             # Colour notch on left side
-            rect_node_colour = QRect(rect_new_area)
-            rect_node_colour.setWidth(8)
-            if isinstance(node_colour, basestring):
-                colour = QColor(node_colour)
-            else:
-                node_colour = list(node_colour or [0, 0, 0]) # fallback if None
-                node_colour.append(1.0)
-                colour = QColor.fromRgbF(*node_colour)
+            rect_node_colour = self._rect_node_colour
+            rect_node_colour.setRect(
+                rect_new_area.x(), rect_new_area.y(), 8, rect_new_area.height())
+            colour = self._get_paint_colour(node_colour, normalized=True)
             painter.fillRect(rect_node_colour, colour)
 
             # Colour stroke on outline
-            pen = QPen()
-            pen.setWidth(1)
-            pen.setColor(colour)
-            painter.setPen(pen)
+            painter.setPen(self._get_outline_pen(colour))
             painter.drawRect(rect_new_area)
 
         # Paint a disabled hint
         if self._draw_header_disabled_hint and not enabled:
             hint_width = 10
-            hint_color = QColor(200, 30, 30)
-            rect_disabled_hint = QRect(rect_new_area)
+            rect_disabled_hint = self._rect_disabled_hint
             # rect_disabled_hint.translate(rect_disabled_hint.width() - 9, 0)
             # rect_disabled_hint.setWidth(8)
-            rect_disabled_hint.translate(rect_disabled_hint.width() - (hint_width + 1), 0)
-            rect_disabled_hint.setWidth(hint_width)
-            pen = QPen()
-            pen.setWidth(2)
-            # pen.setColor(QColor(255, 0, 0))
-            pen.setColor(hint_color)
-            painter.setPen(pen)
+            rect_disabled_hint.setRect(
+                rect_new_area.x() + rect_new_area.width() - (hint_width + 1),
+                rect_new_area.y(),
+                hint_width,
+                rect_new_area.height())
+            # NOTE: Only the diagonal hint lines require antialiasing, not the rectangles
+            # painter.setRenderHint(QPainter.HighQualityAntialiasing)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self.DISABLED_HINT_PEN)
             painter.drawLine(
                 rect_disabled_hint.topLeft(),
                 rect_disabled_hint.bottomRight())
             painter.drawLine(
                 rect_disabled_hint.bottomLeft(),
                 rect_disabled_hint.topRight())
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
         model = self.model()
 
@@ -8540,9 +8994,7 @@ class MultiShotHeaderView(QHeaderView):
 
             painter.setFont(font)
 
-            pen = QPen()
-            pen.setColor(QColor(0, 0, 0))
-            painter.setPen(pen)
+            painter.setPen(self.LABEL_PEN)
 
             painter.drawText(
                 rect,
@@ -8580,4 +9032,4 @@ QTreeView {
     show-decoration-selected: 1;
 }
 '''
-    return default_style_sheet
\ No newline at end of file
+    return default_style_sheet
\ No newline at end of file
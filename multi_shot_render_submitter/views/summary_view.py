@@ -54,6 +54,8 @@ class SummaryView(base_tree_view.BaseTreeView):
 
         ######################################################################
 
+        # NOTE: Every row is NORMAL_ROW_HEIGHT of SummaryModel (which the delegate
+        # editor widgets are fixed to), so only one row height needs to be measured for layout.
         self.setUniformRowHeights(True)
         self.setSelectionMode(QTreeView.ExtendedSelection)
         self.setSelectionBehavior(QTreeView.SelectRows)
@@ -390,7 +392,9 @@ class SummaryView(base_tree_view.BaseTreeView):
         if isinstance(model, QSortFilterProxyModel):
             source_model = model.sourceModel()
 
-        selection = self.selectionModel().selectedRows()
+        # NOTE: Selected rows at post task column, so sibling index not required
+        selection = self.selectionModel().selectedRows(
+            source_model.COLUMN_OF_POST_TASK)
         for qmodelindex in selection:
             if not qmodelindex.isValid():
                 continue
@@ -401,10 +405,7 @@ class SummaryView(base_tree_view.BaseTreeView):
             if item.is_group_item():
                 continue
 
-            qmodelindex_post_task = qmodelindex.sibling(
-                qmodelindex.row(),
-                source_model.COLUMN_OF_POST_TASK)
-            widget = self.indexWidget(qmodelindex_post_task)
+            widget = self.indexWidget(qmodelindex)
             if not widget:
                 continue
 
@@ -441,7 +442,9 @@ class SummaryView(base_tree_view.BaseTreeView):
 
         self._copied_post_tasks = None
 
-        selection = self.selectionModel().selectedRows()
+        # NOTE: Selected rows at post task column, so sibling index not required
+        selection = self.selectionModel().selectedRows(
+            source_model.COLUMN_OF_POST_TASK)
         for qmodelindex in selection:
             if not qmodelindex.isValid():
                 continue
@@ -452,10 +455,7 @@ class SummaryView(base_tree_view.BaseTreeView):
             if item.is_group_item():
                 continue
 
-            qmodelindex_post_task = qmodelindex.sibling(
-                qmodelindex.row(),
-                source_model.COLUMN_OF_POST_TASK)
-            widget = self.indexWidget(qmodelindex_post_task)
+            widget = self.indexWidget(qmodelindex)
             if not widget:
                 continue
 
@@ -488,7 +488,9 @@ class SummaryView(base_tree_view.BaseTreeView):
         if isinstance(model, QSortFilterProxyModel):
             source_model = model.sourceModel()
 
-        selection = self.selectionModel().selectedRows()
+        # NOTE: Selected rows at post task column, so sibling index not required
+        selection = self.selectionModel().selectedRows(
+            source_model.COLUMN_OF_POST_TASK)
         for qmodelindex in selection:
             if not qmodelindex.isValid():
                 continue
@@ -499,10 +501,7 @@ class SummaryView(base_tree_view.BaseTreeView):
             if item.is_group_item():
                 continue
 
-            qmodelindex_post_task = qmodelindex.sibling(
-                qmodelindex.row(),
-                source_model.COLUMN_OF_POST_TASK)
-            widget = self.indexWidget(qmodelindex_post_task)
+            widget = self.indexWidget(qmodelindex)
             if not widget:
                 continue
 
@@ -540,7 +539,9 @@ class SummaryView(base_tree_view.BaseTreeView):
         if isinstance(model, QSortFilterProxyModel):
             source_model = model.sourceModel()
 
-        selection = self.selectionModel().selectedRows()
+        # NOTE: Selected rows at note column, so sibling index not required
+        selection = self.selectionModel().selectedRows(
+            source_model.COLUMN_OF_SUBMISSION_NOTE)
         for qmodelindex in selection:
             if not qmodelindex.isValid():
                 continue
@@ -551,10 +552,7 @@ class SummaryView(base_tree_view.BaseTreeView):
             if item.is_group_item():
                 continue
 
-            qmodelindex_notes = qmodelindex.sibling(
-                qmodelindex.row(),
-                source_model.COLUMN_OF_SUBMISSION_NOTE)
-            widget = self.indexWidget(qmodelindex_notes)
+            widget = self.indexWidget(qmodelindex)
             if not widget:
                 continue
 
@@ -651,7 +649,9 @@ class SummaryView(base_tree_view.BaseTreeView):
         if isinstance(model, QSortFilterProxyModel):
             source_model = model.sourceModel()
 
-        selection = self.selectionModel().selectedRows()
+        # NOTE: Selected rows at note column, so sibling index not required
+        selection = self.selectionModel().selectedRows(
+            source_model.COLUMN_OF_SUBMISSION_NOTE)
         for qmodelindex in selection:
             if not qmodelindex.isValid():
                 continue
@@ -662,10 +662,7 @@ class SummaryView(base_tree_view.BaseTreeView):
             if item.is_group_item():
                 continue
 
-            qmodelindex_notes = qmodelindex.sibling(
-                qmodelindex.row(),
-                source_model.COLUMN_OF_SUBMISSION_NOTE)
-            widget = self.indexWidget(qmodelindex_notes)
+            widget = self.indexWidget(qmodelindex)
             if not widget:
                 continue
 
@@ -52,7 +52,10 @@ class PostTasksComboBoxWidget(QComboBox):
         super(PostTasksComboBoxWidget, self).__init__(parent=parent)
 
         self._lineEdit_filter = None
+        self._item = item
         self._is_environment_item = item.is_environment_item()
+        self._searchable = bool(searchable)
+        self._populated = False
 
         self.setContextMenuPolicy(Qt.NoContextMenu)
 
@@ -70,17 +73,29 @@ class PostTasksComboBoxWidget(QComboBox):
         self.setMaxVisibleItems(100)
         self.setMinimumContentsLength(150)
 
-        self._populate_model(item)
-
-        # Populate widget with posts tasks from data stored in item
+        # NOTE: The post task model (which queries Koba and may build hundreds
+        # of standard items) is only populated when first required, which is
+        # when popup is shown, or post tasks are set for this widget.
         post_tasks = item.get_post_tasks()
         if post_tasks:
             self._set_post_task_states_from_index(qmodelindex, post_tasks)
 
+
+    def _ensure_populated(self):
+        '''
+        Populate the post tasks model of this combo box, and setup search widget,
+        if not already done.
+        '''
+        if self._populated:
+            return
+        self._populated = True
+
+        self._populate_model(self._item)
+
         self._model.itemChanged.connect(self._post_task_item_changed)
 
         # Setup this widget to be searchable
-        if searchable:
+        if self._searchable:
             self._build_search_widget()
             self._lineEdit_filter.searchRequest.connect(
                 self._filter_view_by_search_text)
@@ -112,6 +127,11 @@ class PostTasksComboBoxWidget(QComboBox):
         '''
         if not post_tasks:
             post_tasks = list()
+        # Nothing to uncheck if post tasks model not yet populated
+        if not post_tasks and not self._populated:
+            self._update_display_text(list())
+            return
+        self._ensure_populated()
         self.blockSignals(True)
         model = self.model()
         icon = None
@@ -171,6 +191,9 @@ class PostTasksComboBoxWidget(QComboBox):
             post_tasks (list):
         '''
         post_tasks = list()
+        # No post tasks can be checked until post tasks model is populated
+        if not self._populated:
+            return post_tasks
         model = self.model()
         icon = None
         for row in range(model.rowCount(QModelIndex())):
@@ -607,6 +630,7 @@ class PostTasksComboBoxWidget(QComboBox):
 
 
     def showPopup(self):
+        self._ensure_populated()
         QComboBox.showPopup(self)
         if self._lineEdit_filter:
             # if c++ objecxt pointer already cleaned up
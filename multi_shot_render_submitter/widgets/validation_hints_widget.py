@@ -8,6 +8,10 @@ from srnd_multi_shot_render_submitter.constants import Constants
 constants = Constants()
 
 
+# Font metrics, pens and colours to paint validation hints, built once when first painted
+_PAINT_OBJECTS = None
+
+
 ##############################################################################
 
 
@@ -31,15 +35,7 @@ class ValidationHintsWidget(QWidget):
         self._critical_count = critical_count
         self._warning_count = warning_count
 
-        self._pixmap_critical = None
-        self._pixmap_warning = None
-
-        # TODO: Should reimplement in the srnd_katana_render_submitter repo
-        if constants.IN_KATANA:
-            from UI4.Util import IconManager
-            from wkatana.preflight import dialog
-            self._pixmap_critical = IconManager.GetPixmap(dialog.SEVERE_ICON_PATH)
-            self._pixmap_warning = IconManager.GetPixmap(dialog.WARNING_ICON_PATH)
+        self._pixmap_critical, self._pixmap_warning = get_validation_hint_pixmaps()
 
 
     def set_validation_warning_counter(self, count):
@@ -53,86 +49,156 @@ class ValidationHintsWidget(QWidget):
         '''
         Paint two squares (with rounded corners) with counter inside
         '''
-        rect = event.rect()
-        cell_width = rect.width()
-        cell_height = rect.height()
-
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.HighQualityAntialiasing)
+        paint_validation_hints(
+            painter,
+            self.rect(),
+            self._critical_count,
+            self._warning_count,
+            pixmap_critical=self._pixmap_critical,
+            pixmap_warning=self._pixmap_warning)
+
 
-        pen = QPen()
-        pen.setWidth(1)
-        pen.setColor(QColor(255, 255, 255))
+##############################################################################
+
+
+def get_validation_hint_pixmaps():
+    '''
+    Get the critical and warning icon pixmaps of host app (if any).
+
+    Returns:
+        pixmap_critical, pixmap_warning (tuple):
+    '''
+    # TODO: Should reimplement in the srnd_katana_render_submitter repo
+    if constants.IN_KATANA:
+        from UI4.Util import IconManager
+        from wkatana.preflight import dialog
+        return (
+            IconManager.GetPixmap(dialog.SEVERE_ICON_PATH),
+            IconManager.GetPixmap(dialog.WARNING_ICON_PATH))
+    return None, None
 
+
+def get_validation_hint_paint_objects():
+    '''
+    Get the font metrics, pens and colours to paint validation hints.
+    Note: These are built once on first call (after QApplication exists),
+    since hints are painted for every environment row on every repaint.
+
+    Returns:
+        paint_objects (tuple): font metrics, text, critical and warning pens,
+            then critical and warning colours
+    '''
+    global _PAINT_OBJECTS
+    if _PAINT_OBJECTS is None:
         font = QFont()
         font.setFamily('Bitstream Vera Sans')
         font.setBold(True)
         font.setPointSize(8)
 
-        font_metrics = QFontMetrics(font, painter.device())
-
-        HEIGHT = self.height()
-        HALF_HEIGHT = int(HEIGHT / 2.0)
-        SPACING = 10
-        RECT_SOURCE_ICON = QRectF(0, 0, HEIGHT, HEIGHT)
-
-        previous_width = 0
-        if self._critical_count:
-            if self._pixmap_critical:
-                painter.setPen(Qt.NoPen)
-                critical_str = str(self._critical_count)
-                rect_icon = QRectF(0, 0, HEIGHT, HEIGHT)
-                painter.drawPixmap(rect_icon, self._pixmap_critical, RECT_SOURCE_ICON)
-                pen.setColor(QColor(255, 0, 0))
-                painter.setPen(pen)
-                width = font_metrics.width(critical_str)
-                rect_icon.translate(QPoint(HALF_HEIGHT, 0))
-                painter.drawText(
-                    rect_icon,
-                    Qt.AlignCenter,
-                    critical_str)
-                previous_width = rect_icon.bottomRight().x()
-            else:
-                painter.setPen(Qt.NoPen)
-                critical_str = str(self._critical_count)
-                width = font_metrics.width(critical_str) + 10
-                height = self.height() - 4
-                rect_critical = QRect(2, 2, width, height)
-                painter.setBrush(QColor(255, 0, 0))
-                painter.drawRect(rect_critical)
-                # painter.drawRoundedRect(rect_critical, 8, 8)
-                previous_width = int(width)
-                painter.setPen(pen)
-                painter.drawText(
-                    rect_critical,
-                    Qt.AlignCenter,
-                    critical_str)
-
-        if self._warning_count:
-            if self._pixmap_warning:
-                painter.setPen(Qt.NoPen)
-                warning_str = str(self._warning_count)
-                rect_icon = QRectF(previous_width, 0, HEIGHT, HEIGHT)
-                painter.drawPixmap(rect_icon, self._pixmap_warning, RECT_SOURCE_ICON)
-                pen.setColor(QColor(255, 165, 0))
-                painter.setPen(pen)
-                width = font_metrics.width(warning_str)
-                rect_icon.translate(QPoint(HALF_HEIGHT, 0))
-                painter.drawText(
-                    rect_icon,
-                    Qt.AlignCenter,
-                    warning_str)
-            else:
-                painter.setPen(Qt.NoPen)
-                warning_str = str(self._warning_count)
-                width = font_metrics.width(warning_str) + 10
-                height = self.height() - 4
-                rect_warning = QRect(2 + previous_width + 5, 2, width, height)
-                painter.setBrush(QColor(235, 150, 0))
-                painter.drawRect(rect_warning)
-                # painter.drawRoundedRect(rect_warning, 8, 8)
-                painter.setPen(pen)
-                painter.drawText(
-                    rect_warning,
-                    Qt.AlignCenter,
-                    warning_str)
\ No newline at end of file
+        pens = list()
+        for qcolour in [
+                QColor(255, 255, 255),
+                QColor(255, 0, 0),
+                QColor(255, 165, 0)]:
+            pen = QPen(qcolour)
+            pen.setWidth(1)
+            pens.append(pen)
+        pen_text, pen_critical, pen_warning = pens
+
+        _PAINT_OBJECTS = (
+            QFontMetrics(font),
+            pen_text,
+            pen_critical,
+            pen_warning,
+            QColor(255, 0, 0),
+            QColor(235, 150, 0))
+    return _PAINT_OBJECTS
+
+
+def paint_validation_hints(
+        painter,
+        rect,
+        critical_count,
+        warning_count,
+        pixmap_critical=None,
+        pixmap_warning=None):
+    '''
+    Paint two squares (with rounded corners) with counter inside, within rect.
+    Note: Is shared by ValidationHintsWidget and delegates which paint hints without a widget.
+
+    Args:
+        painter (QPainter):
+        rect (QRect):
+        critical_count (int):
+        warning_count (int):
+        pixmap_critical (QPixmap):
+        pixmap_warning (QPixmap):
+    '''
+    painter.setRenderHint(QPainter.HighQualityAntialiasing)
+
+    font_metrics, pen_text, pen_critical, pen_warning, qcolour_critical, qcolour_warning = \
+        get_validation_hint_paint_objects()
+
+    X = rect.x()
+    Y = rect.y()
+    HEIGHT = rect.height()
+    HALF_HEIGHT = int(HEIGHT / 2.0)
+    RECT_SOURCE_ICON = QRectF(0, 0, HEIGHT, HEIGHT)
+
+    previous_width = 0
+    if critical_count:
+        if pixmap_critical:
+            painter.setPen(Qt.NoPen)
+            critical_str = str(critical_count)
+            rect_icon = QRectF(X, Y, HEIGHT, HEIGHT)
+            painter.drawPixmap(rect_icon, pixmap_critical, RECT_SOURCE_ICON)
+            painter.setPen(pen_critical)
+            rect_icon.translate(QPoint(HALF_HEIGHT, 0))
+            painter.drawText(
+                rect_icon,
+                Qt.AlignCenter,
+                critical_str)
+            previous_width = rect_icon.bottomRight().x() - X
+        else:
+            painter.setPen(Qt.NoPen)
+            critical_str = str(critical_count)
+            width = font_metrics.width(critical_str) + 10
+            height = HEIGHT - 4
+            rect_critical = QRect(X + 2, Y + 2, width, height)
+            painter.setBrush(qcolour_critical)
+            painter.drawRect(rect_critical)
+            # painter.drawRoundedRect(rect_critical, 8, 8)
+            previous_width = int(width)
+            painter.setPen(pen_text)
+            painter.drawText(
+                rect_critical,
+                Qt.AlignCenter,
+                critical_str)
+
+    if warning_count:
+        if pixmap_warning:
+            painter.setPen(Qt.NoPen)
+            warning_str = str(warning_count)
+            rect_icon = QRectF(X + previous_width, Y, HEIGHT, HEIGHT)
+            painter.drawPixmap(rect_icon, pixmap_warning, RECT_SOURCE_ICON)
+            painter.setPen(pen_warning)
+            rect_icon.translate(QPoint(HALF_HEIGHT, 0))
+            painter.drawText(
+                rect_icon,
+                Qt.AlignCenter,
+                warning_str)
+        else:
+            painter.setPen(Qt.NoPen)
+            warning_str = str(warning_count)
+            width = font_metrics.width(warning_str) + 10
+            height = HEIGHT - 4
+            rect_warning = QRect(X + 2 + previous_width + 5, Y + 2, width, height)
+            painter.setBrush(qcolour_warning)
+            painter.drawRect(rect_warning)
+            # painter.drawRoundedRect(rect_warning, 8, 8)
+            painter.setPen(pen_text)
+            painter.drawText(
+                rect_warning,
+                Qt.AlignCenter,
+                warning_str)